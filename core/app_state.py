@@ -107,6 +107,7 @@ class AppState:
         
         # Shared Data for Curses UI
         self.shared_data: Dict[str, Dict[str, Any]] = {}
+        self.data_version: int = 0  # Bumped under data_lock by every writer of shared_data
         
         # Locks
         self.data_lock = threading.RLock()
@@ -162,3 +163,29 @@ class AppState:
         self.current_version = version
         self.latest_version: Optional[str] = None
         self.update_check_completed = False
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns a shallow copy of shared_data taken under data_lock.
+
+        The per-key entries are shared with the live tree, not copied. The data
+        processor publishes new entry dicts every cycle; the plugin manager does
+        update ``<instance>_core_plugin_connection_status`` entries in place, but only
+        by assigning a scalar to ``["value"]``. Readers therefore see either the old
+        or the new value and need only their own top-level mapping (no deep copy),
+        but must not hold nested references across reads.
+        """
+        with self.data_lock:
+            return self.shared_data.copy()
+
+    def snapshot_into(self, dst: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Like snapshot(), but refills the caller-owned dict in place and returns it.
+
+        Lets a long-running reader (the console dashboard) reuse one buffer every
+        tick instead of allocating a new top-level dict per snapshot.
+        """
+        with self.data_lock:
+            dst.clear()
+            dst.update(self.shared_data)
+        return dst
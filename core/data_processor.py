@@ -282,6 +282,7 @@ def process_and_merge_data(app_state: AppState, db_service: 'DatabaseService', t
         
         with app_state.data_lock:
             app_state.shared_data = final_data_packet
+            app_state.data_version += 1
 
         dispatch_package = {
             'merged_data': final_data_packet,
@@ -236,6 +236,7 @@ def poll_single_plugin_instance_thread(instance_id: str, app_state: AppState, da
                     # Provide immediate UI feedback
                     with app_state.data_lock:
                         app_state.shared_data.setdefault(status_key, {})["value"] = plugin_inst.connection_status
+                        app_state.data_version += 1
 
                     if plugin_inst.connect():
                         plugin_inst.connection_status = "connected"
@@ -351,6 +352,7 @@ def poll_single_plugin_instance_thread(instance_id: str, app_state: AppState, da
             # Update the UI status for this plugin
             with app_state.data_lock:
                 app_state.shared_data.setdefault(status_key, {})["value"] = plugin_inst.connection_status
+                app_state.data_version += 1
 
         except Exception as e:
             thread_logger.error(f"Unhandled exception in poll loop: {e}", exc_info=True)
@@ -359,6 +361,7 @@ def poll_single_plugin_instance_thread(instance_id: str, app_state: AppState, da
             plugin_inst.connection_status = STATUS_ERROR
             with app_state.data_lock:
                 app_state.shared_data.setdefault(status_key, {})["value"] = plugin_inst.connection_status
+                app_state.data_version += 1
 
         cycle_duration = time.monotonic() - cycle_start_time
         sleep_time = max(0.1, app_state.poll_interval - cycle_duration)
@@ -20,7 +20,7 @@ GitHub Project: https://github.com/jcvsite/solar-monitoring
 License: MIT
 """
 
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from core.app_state import AppState
@@ -71,7 +71,7 @@ BMS_KEY_FIRMWARE_VERSION = StandardDataKeys.STATIC_BATTERY_FIRMWARE_VERSION
 BMS_KEY_HARDWARE_VERSION = StandardDataKeys.STATIC_BMS_HARDWARE_VERSION
 BMS_KEY_CELL_DISCONNECTION_PREFIX = "bms_cell_disconnection_status_"
 
-class BMSPluginBase(DevicePlugin, ABC):
+class BMSPluginBase(DevicePlugin):
     """
     Abstract Base Class for Battery Management System (BMS) plugins.
 
@@ -97,19 +97,8 @@ class BMSPluginBase(DevicePlugin, ABC):
         """
         super().__init__(instance_name, plugin_specific_config, main_logger, app_state)
         self.latest_data_cache: Dict[str, Any] = {}
-        self._is_connected_flag: bool = False
         self.last_error_message: Optional[str] = None
 
-    @property
-    def is_connected(self) -> bool:
-        """
-        Returns the connection status of the plugin.
-
-        Returns:
-            bool: True if the plugin is connected to the device, False otherwise.
-        """
-        return self._is_connected_flag
-
     @staticmethod
     @abstractmethod
     def get_configurable_params() -> List[Dict[str, Any]]:
@@ -110,7 +110,7 @@ class DalyBmsPlugin(BMSPluginBase):
                 if serial is None:
                     raise ImportError("pyserial required")
                 self._io = serial.Serial(self.serial_port, self.baud_rate, timeout=self.timeout)
-            self._is_connected_flag = True
+            self.is_connected = True
             return True
         except Exception as e:
             self.last_error_message = str(e)
@@ -124,7 +124,7 @@ class DalyBmsPlugin(BMSPluginBase):
             except Exception:
                 pass
         self._io = None
-        self._is_connected_flag = False
+        self.is_connected = False
 
     def _query(self, data_id: int) -> List[bytes]:
         cmd = build_query(data_id)
@@ -111,12 +111,12 @@ class JbdBmsPlugin(BMSPluginBase):
                 if serial is None:
                     raise ImportError("pyserial required")
                 self._io = serial.Serial(self.serial_port, self.baud_rate, timeout=self.timeout)
-            self._is_connected_flag = True
+            self.is_connected = True
             return True
         except Exception as e:
             self.last_error_message = str(e)
             self.logger.error("JBD connect failed: %s", e)
-            self._is_connected_flag = False
+            self.is_connected = False
             return False
 
     def disconnect(self) -> None:
@@ -126,7 +126,7 @@ class JbdBmsPlugin(BMSPluginBase):
             except Exception:
                 pass
         self._io = None
-        self._is_connected_flag = False
+        self.is_connected = False
 
     def _xfer(self, cmd: bytes) -> bytes:
         if not self._io:
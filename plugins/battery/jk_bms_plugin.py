@@ -171,7 +171,7 @@ class JkBmsPlugin(BMSPluginBase):
             return self._connect_uart()
         except Exception as e:
             self.logger.error(f"JK BMS '{self.instance_name}': connect failed: {e}")
-            self._is_connected_flag = False
+            self.is_connected = False
             self.connection_status = "Connect Failed"
             return False
 
@@ -195,7 +195,7 @@ class JkBmsPlugin(BMSPluginBase):
                 stopbits=serial.STOPBITS_ONE,
                 timeout=self.timeout,
             )
-        self._is_connected_flag = True
+        self.is_connected = True
         self.connection_status = "connected"
         self.logger.info(f"JK BMS '{self.instance_name}': UART connected ({self.connection_type}).")
         return True
@@ -216,7 +216,7 @@ class JkBmsPlugin(BMSPluginBase):
             )
         if not self.client.connect():
             return False
-        self._is_connected_flag = True
+        self.is_connected = True
         self.connection_status = "connected"
         self.logger.info(f"JK BMS '{self.instance_name}': Modbus connected ({self.connection_type}).")
         return True
@@ -235,7 +235,7 @@ class JkBmsPlugin(BMSPluginBase):
             self.logger.debug(f"JK BMS disconnect error: {e}")
         finally:
             self.client = None
-            self._is_connected_flag = False
+            self.is_connected = False
             self.connection_status = "disconnected"
 
     def _uart_exchange(self, command: bytes, settle_s: float = 0.35) -> bytes:
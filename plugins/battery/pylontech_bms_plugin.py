@@ -107,7 +107,7 @@ class PylontechBmsPlugin(BMSPluginBase):
                 if serial is None:
                     raise ImportError("pyserial required")
                 self._io = serial.Serial(self.serial_port, self.baud_rate, timeout=self.timeout)
-            self._is_connected_flag = True
+            self.is_connected = True
             # Best-effort identity
             try:
                 info = self._cmd("info")
@@ -122,7 +122,7 @@ class PylontechBmsPlugin(BMSPluginBase):
         except Exception as e:
             self.last_error_message = str(e)
             self.logger.error("Pylontech connect failed: %s", e)
-            self._is_connected_flag = False
+            self.is_connected = False
             return False
 
     def disconnect(self) -> None:
@@ -132,7 +132,7 @@ class PylontechBmsPlugin(BMSPluginBase):
             except Exception:
                 pass
         self._io = None
-        self._is_connected_flag = False
+        self.is_connected = False
 
     def _cmd(self, command: str) -> str:
         line = (command.strip() + "\r").encode("ascii")
@@ -345,7 +345,7 @@ class SeplosBMSV2(BMSPluginBase):
         Returns:
             bool: True on successful connection, False otherwise.
         """
-        if self._is_connected_flag and self.client:
+        if self.is_connected and self.client:
             return True
         if self.client: self.disconnect()
         self.last_error_message = "Plugin disabled (config error)" if self.connection_type == "disabled" else None
@@ -373,7 +373,7 @@ class SeplosBMSV2(BMSPluginBase):
                 self.client.connect((self.tcp_host, self.tcp_port))
             else: return False
 
-            self._is_connected_flag = True
+            self.is_connected = True
             self.logger.info(f"SeplosBMSV2 '{self.instance_name}': Successfully connected.")
             return True
         except Exception as e:
@@ -383,7 +383,7 @@ class SeplosBMSV2(BMSPluginBase):
                 try: self.client.close()
                 except: pass
             self.client = None
-            self._is_connected_flag = False
+            self.is_connected = False
             return False
 
     def disconnect(self) -> None:
@@ -399,7 +399,7 @@ class SeplosBMSV2(BMSPluginBase):
                     except socket.error: pass 
                     self.client.close()
             except Exception as e: self.logger.error(f"SeplosBMSV2 '{self.instance_name}' {conn_type_msg}: Error during disconnect: {e}")
-        self._is_connected_flag = False
+        self.is_connected = False
         self.client = None
 
     @staticmethod
@@ -608,7 +608,7 @@ class SeplosBMSV2(BMSPluginBase):
             Optional[bytes]: The INFO payload of the valid response frame, or None on failure.
         """
         self.last_error_message = None 
-        if not self._is_connected_flag or not self.client:
+        if not self.is_connected or not self.client:
             self.last_error_message = "Client not connected for send/receive"
             if self.connect(): self.logger.info(f"S '{self.instance_name}': Reconnected successfully for S/R.")
             else: return None
@@ -1076,7 +1076,7 @@ class SeplosBMSV2(BMSPluginBase):
             operation fails at any stage.
         """
         self.last_error_message = None
-        if not self._is_connected_flag:
+        if not self.is_connected:
             if not self.connect():
                 self.logger.error(f"S '{self.instance_name}': Connection failed. Cannot read data.")
                 return None
@@ -1095,7 +1095,7 @@ class SeplosBMSV2(BMSPluginBase):
         if self.inter_command_delay_ms > 0:
             time.sleep(self.inter_command_delay_ms / 1000.0)
 
-        if self._is_connected_flag:
+        if self.is_connected:
             payload_ts = self._send_receive_seplos_frame(self._encode_cmd(CMD_READ_TELESIGNALIZATION))
             if payload_ts:
                 decoded_ts = self._decode_telesignalization_payload(payload_ts)
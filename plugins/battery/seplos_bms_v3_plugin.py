@@ -149,14 +149,14 @@ class SeplosBmsV3Plugin(DevicePlugin):
         Returns:
             bool: True on successful connection, False otherwise.
         """
-        if self._is_connected_flag: return True
+        if self.is_connected: return True
         if self.connection_type == "tcp":
             if not check_tcp_port(self.tcp_host, self.tcp_port, logger_instance=self.logger)[0]:
                 self.last_error_message = f"TCP port check failed for {self.tcp_host}:{self.tcp_port}"
                 return False
         try:
             if self.client.connect():
-                self._is_connected_flag = True; return True
+                self.is_connected = True; return True
         except Exception as e:
             self.last_error_message = f"Connection exception: {e}"
         return False
@@ -164,7 +164,7 @@ class SeplosBmsV3Plugin(DevicePlugin):
     def disconnect(self) -> None:
         """Closes the Modbus connection."""
         if self.client: self.client.close()
-        self._is_connected_flag = False
+        self.is_connected = False
 
     def read_static_data(self) -> Optional[Dict[str, Any]]:
         """
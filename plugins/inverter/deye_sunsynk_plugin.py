@@ -303,7 +303,7 @@ class DeyeSunsynkPlugin(DevicePlugin):
         Returns:
             True if connection successful, False otherwise
         """
-        if self._is_connected_flag and self.client: return True
+        if self.is_connected and self.client: return True
         if self.client: self.disconnect()
         self.last_error_message = None
 
@@ -325,7 +325,7 @@ class DeyeSunsynkPlugin(DevicePlugin):
                 self.client = ModbusTcpClient(host=self.tcp_host, port=self.tcp_port, timeout=self.modbus_timeout_seconds)
             
             if self.client.connect():
-                self._is_connected_flag = True
+                self.is_connected = True
                 self.logger.info(f"DeyePlugin '{self.instance_name}': Successfully connected.")
                 if self.model_series_cfg == "auto" and not self._series_auto_detected:
                     self._auto_detect_model_series()
@@ -338,7 +338,7 @@ class DeyeSunsynkPlugin(DevicePlugin):
         
         if self.client: self.client.close()
         self.client = None
-        self._is_connected_flag = False
+        self.is_connected = False
         return False
 
     def disconnect(self) -> None:
@@ -354,7 +354,7 @@ class DeyeSunsynkPlugin(DevicePlugin):
                 self.client.close()
             except Exception as e:
                 self.logger.error(f"Error closing Modbus connection: {e}", exc_info=True)
-        self._is_connected_flag = False
+        self.is_connected = False
         self.client = None
 
     def _is_client_connected(self) -> bool:
@@ -144,7 +144,7 @@ class Eg4ModbusPlugin(DevicePlugin):
         Returns:
             True if the connection was successful, False otherwise.
         """
-        if self._is_connected_flag and self.client:
+        if self.is_connected and self.client:
             return True
         if self.client:
             self.disconnect()
@@ -172,7 +172,7 @@ class Eg4ModbusPlugin(DevicePlugin):
                 self.client = ModbusTcpClient(host=self.tcp_host, port=self.tcp_port, timeout=self.modbus_timeout_seconds)
             
             if self.client.connect():
-                self._is_connected_flag = True
+                self.is_connected = True
                 self.logger.info(f"EG4 Plugin '{self.instance_name}': Successfully connected.")
                 return True
             else:
@@ -184,7 +184,7 @@ class Eg4ModbusPlugin(DevicePlugin):
         if self.client:
             self.client.close()
         self.client = None
-        self._is_connected_flag = False
+        self.is_connected = False
         return False
 
     def disconnect(self) -> None:
@@ -196,7 +196,7 @@ class Eg4ModbusPlugin(DevicePlugin):
             except Exception as e:
                 self.logger.error(f"EG4 Plugin '{self.instance_name}': Error closing Modbus connection: {e}", exc_info=True)
         self.client = None
-        self._is_connected_flag = False
+        self.is_connected = False
 
     def read_static_data(self) -> Dict[str, Any]:
         """
@@ -154,7 +154,7 @@ class GrowattModbusPlugin(DevicePlugin):
         Returns:
             True if the connection was successful, False otherwise.
         """
-        if self._is_connected_flag and self.client:
+        if self.is_connected and self.client:
             return True
         if self.client:
             self.disconnect()
@@ -182,7 +182,7 @@ class GrowattModbusPlugin(DevicePlugin):
                 self.client = ModbusTcpClient(host=self.tcp_host, port=self.tcp_port, timeout=self.modbus_timeout_seconds)
             
             if self.client.connect():
-                self._is_connected_flag = True
+                self.is_connected = True
                 self.logger.info(f"Growatt Plugin '{self.instance_name}': Successfully connected.")
                 return True
             else:
@@ -194,7 +194,7 @@ class GrowattModbusPlugin(DevicePlugin):
         if self.client:
             self.client.close()
         self.client = None
-        self._is_connected_flag = False
+        self.is_connected = False
         return False
 
     def disconnect(self) -> None:
@@ -206,7 +206,7 @@ class GrowattModbusPlugin(DevicePlugin):
             except Exception as e:
                 self.logger.error(f"Growatt Plugin '{self.instance_name}': Error closing Modbus connection: {e}", exc_info=True)
         self.client = None
-        self._is_connected_flag = False
+        self.is_connected = False
 
     def read_static_data(self) -> Dict[str, Any]:
         """
@@ -219,7 +219,7 @@ class LuxpowerModbusPlugin(DevicePlugin):
         Returns:
             True if the connection was successful, False otherwise.
         """
-        if self._is_connected_flag and self.client:
+        if self.is_connected and self.client:
             return True
         if self.client:
             self.disconnect()
@@ -244,7 +244,7 @@ class LuxpowerModbusPlugin(DevicePlugin):
                 self.client = ModbusTcpClient(host=self.tcp_host, port=self.tcp_port, timeout=self.modbus_timeout_seconds)
             
             if self.client.connect():
-                self._is_connected_flag = True
+                self.is_connected = True
                 self.logger.info(f"LuxPowerPlugin '{self.instance_name}': Successfully connected.")
                 return True
             else:
@@ -256,7 +256,7 @@ class LuxpowerModbusPlugin(DevicePlugin):
         if self.client:
             self.client.close()
         self.client = None
-        self._is_connected_flag = False
+        self.is_connected = False
         return False
         
     def disconnect(self) -> None:
@@ -267,7 +267,7 @@ class LuxpowerModbusPlugin(DevicePlugin):
                 self.client.close()
             except Exception as e:
                 self.logger.error(f"LuxPowerPlugin '{self.instance_name}': Error closing Modbus connection: {e}", exc_info=True)
-        self._is_connected_flag = False
+        self.is_connected = False
         self.client = None
 
     def read_static_data(self) -> Optional[Dict[str, Any]]:
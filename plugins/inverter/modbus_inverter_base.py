@@ -28,7 +28,7 @@ import logging
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
-from plugins.plugin_interface import DevicePlugin, StandardDataKeys, parse_config_int, parse_config_str
+from plugins.plugin_interface import DevicePlugin, StandardDataKeys, parse_config_bulk
 from plugins.plugin_utils import check_tcp_port, check_icmp_ping
 from plugins.modbus_helper import (
     create_modbus_client,
@@ -55,6 +55,32 @@ class ModbusInverterPluginBase(DevicePlugin):
     default_baud: int = 9600
     default_tcp_port: int = 502
     default_slave: int = 1
+    CONFIG_SCHEMA: Dict[str, Tuple[type, Any]] = {}
+    # Schema entries declared by subclasses along the MRO, kept so later subclasses re-merge them
+    _declared_config_schema: Dict[str, Tuple[type, Any]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # A subclass may declare its own CONFIG_SCHEMA; its entries extend or override the
+        # generated connection settings instead of being replaced by them.
+        cls._declared_config_schema = {
+            **cls._declared_config_schema,
+            **cls.__dict__.get("CONFIG_SCHEMA", {}),
+        }
+        cls.CONFIG_SCHEMA = {**cls._build_config_schema(), **cls._declared_config_schema}
+
+    @classmethod
+    def _build_config_schema(cls) -> Dict[str, Tuple[type, Any]]:
+        """Connection settings schema, using this class's default baud/port/slave."""
+        return {
+            "connection_type": (str, "tcp"),
+            "serial_port": (str, "/dev/ttyUSB0"),
+            "baud_rate": (int, cls.default_baud),
+            "tcp_host": (str, "192.168.1.100"),
+            "tcp_port": (int, cls.default_tcp_port),
+            "slave_address": (int, cls.default_slave),
+            "modbus_timeout_seconds": (str, "5"),
+        }
 
     def __init__(
         self,
@@ -71,20 +97,19 @@ class ModbusInverterPluginBase(DevicePlugin):
                 raise ImportError("pymodbus is required")
         except ImportError as e:
             raise ImportError(f"{self.__class__.__name__} requires pymodbus") from e
+        cfg = parse_config_bulk(plugin_specific_config, self.CONFIG_SCHEMA)
+        # Every CONFIG_SCHEMA entry, parsed once; subclasses read their own declared keys from here
+        self.parsed_config: Dict[str, Any] = cfg
         try:
-            self.connection_type = ConnectionType(
-                (parse_config_str(plugin_specific_config, "connection_type", "tcp") or "tcp").strip().lower()
-            )
+            self.connection_type = ConnectionType((cfg["connection_type"] or "tcp").strip().lower())
         except ValueError:
             self.connection_type = ConnectionType.TCP
-        self.serial_port = parse_config_str(plugin_specific_config, "serial_port", "/dev/ttyUSB0")
-        self.baud_rate = parse_config_int(plugin_specific_config, "baud_rate", self.default_baud)
-        self.tcp_host = parse_config_str(plugin_specific_config, "tcp_host", "192.168.1.100")
-        self.tcp_port = parse_config_int(plugin_specific_config, "tcp_port", self.default_tcp_port)
-        self.slave_address = parse_config_int(plugin_specific_config, "slave_address", self.default_slave)
-        self.modbus_timeout_seconds = float(
-            parse_config_str(plugin_specific_config, "modbus_timeout_seconds", "5") or 5
-        )
+        self.serial_port = cfg["serial_port"]
+        self.baud_rate = cfg["baud_rate"]
+        self.tcp_host = cfg["tcp_host"]
+        self.tcp_port = cfg["tcp_port"]
+        self.slave_address = cfg["slave_address"]
+        self.modbus_timeout_seconds = float(cfg["modbus_timeout_seconds"] or 5)
         self.last_error_message: Optional[str] = None
         self.last_known_static_data: Optional[Dict[str, Any]] = None
         self.client = None
@@ -102,7 +127,7 @@ class ModbusInverterPluginBase(DevicePlugin):
         ]
 
     def connect(self) -> bool:
-        if self._is_connected_flag and self.client:
+        if self.is_connected and self.client:
             return True
         if self.client:
             self.disconnect()
@@ -126,7 +151,7 @@ class ModbusInverterPluginBase(DevicePlugin):
                 timeout=self.modbus_timeout_seconds,
             )
             if self.client.connect():
-                self._is_connected_flag = True
+                self.is_connected = True
                 self.logger.info("%s '%s': connected.", self.pretty_name, self.instance_name)
                 return True
             self.last_error_message = "client.connect() returned False"
@@ -139,7 +164,7 @@ class ModbusInverterPluginBase(DevicePlugin):
             except Exception:
                 pass
         self.client = None
-        self._is_connected_flag = False
+        self.is_connected = False
         return False
 
     def disconnect(self) -> None:
@@ -149,7 +174,7 @@ class ModbusInverterPluginBase(DevicePlugin):
             except Exception as e:
                 self.logger.debug("Error closing Modbus client: %s", e)
         self.client = None
-        self._is_connected_flag = False
+        self.is_connected = False
 
     def _read_holding_block(self, start: int, count: int) -> Optional[List[int]]:
         result = safe_read_holding_registers(
@@ -339,7 +339,7 @@ class PowmrCustomRs232Plugin(DevicePlugin):
             Connection details and error messages are logged appropriately.
             The last_error_message attribute is updated on failure.
         """
-        if self._is_connected_flag and self._validate_connection():
+        if self.is_connected and self._validate_connection():
             return True
             
         # Clean up any existing connections
@@ -371,7 +371,7 @@ class PowmrCustomRs232Plugin(DevicePlugin):
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE
             )
-            self._is_connected_flag = True
+            self.is_connected = True
             self.logger.info(f"POWMR Plugin '{self.instance_name}': Successfully connected via Serial on {self.serial_port_path}")
             return True
         except serial.SerialException as e:
@@ -405,7 +405,7 @@ class PowmrCustomRs232Plugin(DevicePlugin):
             self.tcp_client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.tcp_client.settimeout(10)
             self.tcp_client.connect((self.tcp_host, self.tcp_port))
-            self._is_connected_flag = True
+            self.is_connected = True
             self.logger.info(f"POWMR Plugin '{self.instance_name}': Successfully connected via TCP to {self.tcp_host}:{self.tcp_port}")
             return True
         except (socket.error, OSError) as e:
@@ -455,7 +455,7 @@ class PowmrCustomRs232Plugin(DevicePlugin):
         
         self.serial_client = None
         self.tcp_client = None
-        self._is_connected_flag = False
+        self.is_connected = False
         self.logger.info(f"POWMR Plugin '{self.instance_name}': Disconnected from POWMR inverter")
 
     def read_static_data(self) -> Optional[Dict[str, Any]]:
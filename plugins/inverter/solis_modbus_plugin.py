@@ -259,7 +259,7 @@ class SolisModbusPlugin(DevicePlugin):
         Returns:
             True if the connection was successful, False otherwise.
         """
-        if self._is_connected_flag and self.client: return True
+        if self.is_connected and self.client: return True
         if self.client: self.disconnect()
         self.last_error_message = None
 
@@ -300,7 +300,7 @@ class SolisModbusPlugin(DevicePlugin):
                 self.client.slave_id = self.slave_address
             
             if self.client.connect():
-                self._is_connected_flag = True
+                self.is_connected = True
                 self.logger.info(f"SolisPlugin '{self.instance_name}': Successfully connected.")
                 return True
             else:
@@ -311,7 +311,7 @@ class SolisModbusPlugin(DevicePlugin):
         
         if self.client: self.client.close()
         self.client = None
-        self._is_connected_flag = False
+        self.is_connected = False
         return False
 
     def disconnect(self) -> None:
@@ -322,7 +322,7 @@ class SolisModbusPlugin(DevicePlugin):
                 self.client.close()
             except Exception as e:
                 self.logger.error(f"Error closing Modbus connection: {e}", exc_info=True)
-        self._is_connected_flag = False
+        self.is_connected = False
         self.client = None
 
     def _decode_solis_alerts(self, raw_bitfield_values: Dict[int, int]) -> Tuple[List[int], Dict[str, List[str]]]:
@@ -17,6 +17,7 @@ Features:
 - Battery management system integration
 - Support for multiple SRNE inverter models
 - Automatic retry mechanisms and connection recovery
+- Modbus TCP reads run on a shared asyncio loop so multiple instances overlap
 
 Supported Models:
 - SRNE ML series (hybrid inverters)
@@ -27,14 +28,21 @@ GitHub Project: https://github.com/jcvsite/solar-monitoring
 License: MIT
 """
 
+import asyncio
+import concurrent.futures
 import logging
 import struct
+import threading
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 # This plugin requires the pymodbus library for communication.
 # You can install it with: pip install pymodbus
 try:
     from pymodbus.client import ModbusSerialClient, ModbusTcpClient
+    try:
+        from pymodbus.client import AsyncModbusTcpClient
+    except ImportError:
+        AsyncModbusTcpClient = None
     from pymodbus.exceptions import ConnectionException, ModbusException, ModbusIOException, ConnectionException as ModbusConnectionException
     from pymodbus.pdu import ExceptionResponse
 except ImportError:
@@ -42,6 +50,7 @@ except ImportError:
     # but the plugin will fail gracefully at initialization.
     ModbusSerialClient = None
     ModbusTcpClient = None
+    AsyncModbusTcpClient = None
 
 if TYPE_CHECKING:
     from core.app_state import AppState
@@ -55,9 +64,12 @@ from .srne_modbus_constants import (
 )
 from plugins.plugin_interface import DevicePlugin, StandardDataKeys
 from plugins.plugin_utils import check_tcp_port, check_icmp_ping
+from plugins.modbus_helper import _call_with_slave_compat
 from enum import Enum
 
 UNKNOWN = "Unknown"
+# Shared read-only alerts value for the common no-fault poll (sanitizer copies it downstream).
+_OK_ALERTS = {"inverter": ("OK",)}
 
 class ConnectionType(str, Enum):
     """Enumeration for the supported connection types."""
@@ -85,8 +97,18 @@ class SrneModbusPlugin(DevicePlugin):
     operational data from SRNE controllers using either Modbus TCP (network)
     or Modbus RTU (serial) communication protocols. SRNE controllers are
     primarily DC devices that manage solar panel charging of battery systems.
+
+    Modbus TCP connections use pymodbus' asyncio client driven by a single
+    event loop thread shared by all SRNE instances, so polls from several
+    instances (or several controllers behind one gateway) are in flight
+    concurrently instead of serializing on blocking sockets. Serial RTU stays
+    on the synchronous client since the bus is half-duplex anyway.
     """
 
+    # Shared asyncio loop (daemon thread) for all TCP instances of this plugin.
+    _async_loop: Optional[asyncio.AbstractEventLoop] = None
+    _async_loop_lock = threading.Lock()
+
     def __init__(self, instance_name: str, plugin_specific_config: Dict[str, Any], main_logger: logging.Logger, app_state: Optional['AppState'] = None):
         """
         Initializes the SrneModbusPlugin instance.
@@ -121,6 +143,7 @@ class SrneModbusPlugin(DevicePlugin):
         
         # Modbus communication parameters
         self.modbus_timeout_seconds = int(self.plugin_config.get("modbus_timeout_seconds", 10))
+        self._use_async = self.connection_type == ConnectionType.TCP and AsyncModbusTcpClient is not None
         
         target_info = f"{self.tcp_host}:{self.tcp_port}" if self.connection_type == ConnectionType.TCP else f"{self.serial_port}:{self.baud_rate}"
         self.logger.info(f"SRNE Plugin '{self.instance_name}': Initialized. Conn: {self.connection_type.value}, Target: {target_info}, SlaveID: {self.slave_address}.")
@@ -145,7 +168,7 @@ class SrneModbusPlugin(DevicePlugin):
         Returns:
             True if the connection was successful, False otherwise.
         """
-        if self._is_connected_flag and self.client:
+        if self.is_connected and self.client:
             return True
         if self.client:
             self.disconnect()
@@ -174,15 +197,13 @@ class SrneModbusPlugin(DevicePlugin):
                     parity='N',
                     timeout=self.modbus_timeout_seconds
                 )
-            else:  # TCP
+            elif not self._use_async:  # TCP
                 self.client = ModbusTcpClient(host=self.tcp_host, port=self.tcp_port, timeout=self.modbus_timeout_seconds)
-            
-            # Set slave address on client if supported
-            if hasattr(self.client, 'slave'):
-                self.client.slave = self.slave_address
-                
-            if self.client.connect():
-                self._is_connected_flag = True
+
+            # The unit ID is passed on every request (see _read_holding), never stored on the client.
+            connected = self._run_async(self._async_connect()) if self._use_async else self.client.connect()
+            if connected:
+                self.is_connected = True
                 self.logger.info(f"SRNE Plugin '{self.instance_name}': Successfully connected.")
                 return True
             else:
@@ -192,9 +213,9 @@ class SrneModbusPlugin(DevicePlugin):
             self.logger.error(f"SRNE Plugin '{self.instance_name}': {self.last_error_message}", exc_info=True)
         
         if self.client:
-            self.client.close()
+            self._close_client()
         self.client = None
-        self._is_connected_flag = False
+        self.is_connected = False
         return False
 
     def disconnect(self) -> None:
@@ -202,11 +223,11 @@ class SrneModbusPlugin(DevicePlugin):
         if self.client:
             self.logger.info(f"SRNE Plugin '{self.instance_name}': Disconnecting client.")
             try:
-                self.client.close()
+                self._close_client()
             except Exception as e:
                 self.logger.error(f"SRNE Plugin '{self.instance_name}': Error closing Modbus connection: {e}", exc_info=True)
         self.client = None
-        self._is_connected_flag = False
+        self.is_connected = False
 
     def read_static_data(self) -> Dict[str, Any]:
         """
@@ -231,14 +252,7 @@ class SrneModbusPlugin(DevicePlugin):
             
             # Read Product Model (ASCII)
             model_info = SRNE_STATIC_REGISTERS["product_model"]
-            # Try different parameter formats for pymodbus version compatibility
-            try:
-                result = self.client.read_holding_registers(model_info["addr"], model_info["len"], unit=self.slave_address)
-            except TypeError:
-                try:
-                    result = self.client.read_holding_registers(model_info["addr"], model_info["len"], slave=self.slave_address)
-                except TypeError:
-                    result = self.client.read_holding_registers(model_info["addr"], model_info["len"])
+            result = self._read_holding(model_info["addr"], model_info["len"])
             if not result.isError():
                 static_data[StandardDataKeys.STATIC_INVERTER_MODEL_NAME] = self._decode_string_from_registers(result.registers)
             else:
@@ -246,14 +260,7 @@ class SrneModbusPlugin(DevicePlugin):
 
             # Read Versions
             sw_info = SRNE_STATIC_REGISTERS["software_version"]
-            # Try different parameter formats for pymodbus version compatibility
-            try:
-                result = self.client.read_holding_registers(sw_info["addr"], sw_info["len"], unit=self.slave_address)
-            except TypeError:
-                try:
-                    result = self.client.read_holding_registers(sw_info["addr"], sw_info["len"], slave=self.slave_address)
-                except TypeError:
-                    result = self.client.read_holding_registers(sw_info["addr"], sw_info["len"])
+            result = self._read_holding(sw_info["addr"], sw_info["len"])
             if not result.isError():
                 # V03.02.01 is stored as 0003 0201
                 v_major = result.registers[0] >> 8
@@ -293,14 +300,7 @@ class SrneModbusPlugin(DevicePlugin):
             # Read all dynamic registers in one block (from 0x0100 to 0x0122)
             start_addr = 0x0100
             count = (0x0122 - 0x0100) + 1
-            # Try different parameter formats for pymodbus version compatibility
-            try:
-                result = self.client.read_holding_registers(start_addr, count, unit=self.slave_address)
-            except TypeError:
-                try:
-                    result = self.client.read_holding_registers(start_addr, count, slave=self.slave_address)
-                except TypeError:
-                    result = self.client.read_holding_registers(start_addr, count)
+            result = self._read_holding(start_addr, count)
 
             if result.isError() or isinstance(result, ExceptionResponse):
                 raise ConnectionException(f"Modbus error reading dynamic registers: {result}")
@@ -314,6 +314,57 @@ class SrneModbusPlugin(DevicePlugin):
             self.disconnect()
             return None
 
+    @classmethod
+    def _get_async_loop(cls) -> asyncio.AbstractEventLoop:
+        """Returns the shared asyncio loop, starting its daemon thread on first use."""
+        with cls._async_loop_lock:
+            if cls._async_loop is None or cls._async_loop.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="SrneModbusAsyncLoop", daemon=True).start()
+                cls._async_loop = loop
+            return cls._async_loop
+
+    def _run_async(self, coro) -> Any:
+        """
+        Runs a coroutine on the shared loop and blocks the polling thread for its result.
+
+        Raises:
+            ConnectionException: If the coroutine does not finish within the Modbus timeout.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._get_async_loop())
+        try:
+            return future.result(timeout=self.modbus_timeout_seconds)
+        except concurrent.futures.TimeoutError:  # distinct from the builtin before Python 3.11
+            future.cancel()
+            raise ConnectionException(f"Async Modbus request timed out after {self.modbus_timeout_seconds}s")
+
+    async def _async_connect(self) -> bool:
+        """Creates and connects the async TCP client on the shared loop."""
+        self.client = AsyncModbusTcpClient(host=self.tcp_host, port=self.tcp_port, timeout=self.modbus_timeout_seconds)
+        return bool(await self.client.connect())
+
+    async def _async_read_holding(self, address: int, count: int) -> Any:
+        """Awaits a holding register read on the async client."""
+        return await _call_with_slave_compat(self.client.read_holding_registers, address, count, slave=self.slave_address)
+
+    def _read_holding(self, address: int, count: int) -> Any:
+        """
+        Reads holding registers through the active client.
+
+        TCP requests are dispatched to the shared asyncio loop; serial requests
+        use the synchronous client directly.
+        """
+        if self._use_async:
+            return self._run_async(self._async_read_holding(address, count))
+        return _call_with_slave_compat(self.client.read_holding_registers, address, count, slave=self.slave_address)
+
+    def _close_client(self) -> None:
+        """Closes the active client, on the loop thread when it is the async client."""
+        if self._use_async:
+            self._get_async_loop().call_soon_threadsafe(self.client.close)
+        else:
+            self.client.close()
+
     def _decode_registers(self, registers: List[int], register_map: Dict[str, Any], start_addr: int) -> Dict[str, Any]:
         """
         Decodes raw register values into scaled and typed Python objects.
@@ -327,15 +378,16 @@ class SrneModbusPlugin(DevicePlugin):
             A dictionary of decoded values keyed by register name.
         """
         decoded = {}
+        n_regs = len(registers)
         for key, info in register_map.items():
             addr = info["addr"]
             offset = addr - start_addr
             
-            if offset < 0 or offset >= len(registers):
+            if offset < 0 or offset >= n_regs:
                 continue
             
             if info.get("type") == "uint32":
-                if offset + 1 < len(registers):
+                if offset + 1 < n_regs:
                     value = (registers[offset] << 16) | registers[offset + 1]
                 else:
                     continue
@@ -371,55 +423,61 @@ class SrneModbusPlugin(DevicePlugin):
         Returns:
             A dictionary containing standardized operational data keys and values.
         """
+        get = decoded_data.get  # bound once for the many lookups below
+
         # Decode status and faults
-        status_reg = decoded_data.get("status_register", 0)
+        status_reg = get("status_register", 0)
         batt_status_code = status_reg & 0xFF
         load_status_bit = (status_reg >> 15) & 1 # b7 of high byte
         
         battery_status_text = SRNE_BATTERY_STATUS_CODES.get(batt_status_code, f"Unknown ({batt_status_code})")
         is_charging = "charging" in battery_status_text.lower() and "deactivated" not in battery_status_text.lower()
         
-        charge_current = decoded_data.get("charge_current", 0.0)
-        battery_voltage = decoded_data.get("battery_voltage", 0.0)
+        charge_current = get("charge_current", 0.0)
+        battery_voltage = get("battery_voltage", 0.0)
         
         # Interface standard: current/power are negative for charging
         battery_power = (charge_current * battery_voltage) if is_charging else 0.0
         battery_current_signed = charge_current if is_charging else 0.0
 
         # Temperatures
-        temp_reg = decoded_data.get("temperatures", 0)
+        temp_reg = get("temperatures", 0)
         controller_temp = temp_reg >> 8
         battery_temp = temp_reg & 0xFF
 
         # Faults
-        faults_low = decoded_data.get("fault_info_low", 0)
-        faults_high = decoded_data.get("fault_info_high", 0)
-        alerts = []
-        for i in range(16):
-            if (faults_low >> i) & 1: alerts.append(SRNE_FAULTS_LOW_MAP.get(i, f"Unknown Low Fault Bit {i}"))
-            if (faults_high >> i) & 1: alerts.append(SRNE_FAULTS_HIGH_MAP.get(i, f"Unknown High Fault Bit {i}"))
+        faults_low = get("fault_info_low", 0)
+        faults_high = get("fault_info_high", 0)
+        if not faults_low and not faults_high:
+            categorized_alerts = _OK_ALERTS
+        else:
+            alerts = []
+            for i in range(16):
+                if (faults_low >> i) & 1: alerts.append(SRNE_FAULTS_LOW_MAP.get(i, f"Unknown Low Fault Bit {i}"))
+                if (faults_high >> i) & 1: alerts.append(SRNE_FAULTS_HIGH_MAP.get(i, f"Unknown High Fault Bit {i}"))
+            categorized_alerts = {"inverter": alerts}
 
         return {
             StandardDataKeys.OPERATIONAL_INVERTER_STATUS_TEXT: battery_status_text,
             StandardDataKeys.BATTERY_STATUS_TEXT: battery_status_text,
             StandardDataKeys.AC_POWER_WATTS: 0, # DC-only device
-            StandardDataKeys.PV_TOTAL_DC_POWER_WATTS: decoded_data.get("pv_power"),
-            StandardDataKeys.LOAD_TOTAL_POWER_WATTS: decoded_data.get("load_power"),
+            StandardDataKeys.PV_TOTAL_DC_POWER_WATTS: get("pv_power"),
+            StandardDataKeys.LOAD_TOTAL_POWER_WATTS: get("load_power"),
             StandardDataKeys.BATTERY_POWER_WATTS: -battery_power,
             StandardDataKeys.BATTERY_CURRENT_AMPS: -battery_current_signed,
             StandardDataKeys.OPERATIONAL_INVERTER_TEMPERATURE_CELSIUS: controller_temp,
             StandardDataKeys.BATTERY_TEMPERATURE_CELSIUS: battery_temp,
             StandardDataKeys.BATTERY_VOLTAGE_VOLTS: battery_voltage,
-            StandardDataKeys.BATTERY_STATE_OF_CHARGE_PERCENT: decoded_data.get("battery_soc"),
-            StandardDataKeys.PV_MPPT1_VOLTAGE_VOLTS: decoded_data.get("pv_voltage"),
-            StandardDataKeys.PV_MPPT1_CURRENT_AMPS: decoded_data.get("pv_current"),
-            StandardDataKeys.PV_MPPT1_POWER_WATTS: decoded_data.get("pv_power"),
-            StandardDataKeys.OPERATIONAL_CATEGORIZED_ALERTS_DICT: {"inverter": alerts if alerts else ["OK"]},
-            # Pass through daily totals
-            StandardDataKeys.ENERGY_PV_DAILY_KWH: decoded_data.get("daily_pv_power_generation", 0) / 1000.0,
-            StandardDataKeys.ENERGY_LOAD_DAILY_KWH: decoded_data.get("daily_load_power_consumption", 0) / 1000.0,
+            StandardDataKeys.BATTERY_STATE_OF_CHARGE_PERCENT: get("battery_soc"),
+            StandardDataKeys.PV_MPPT1_VOLTAGE_VOLTS: get("pv_voltage"),
+            StandardDataKeys.PV_MPPT1_CURRENT_AMPS: get("pv_current"),
+            StandardDataKeys.PV_MPPT1_POWER_WATTS: get("pv_power"),
+            StandardDataKeys.OPERATIONAL_CATEGORIZED_ALERTS_DICT: categorized_alerts,
+            # Pass through daily totals (registers are Wh; scale to kWh)
+            StandardDataKeys.ENERGY_PV_DAILY_KWH: (get("daily_pv_power_generation") or 0) * 0.001,
+            StandardDataKeys.ENERGY_LOAD_DAILY_KWH: (get("daily_load_power_consumption") or 0) * 0.001,
             # Pass through lifetime totals
-            StandardDataKeys.ENERGY_PV_TOTAL_LIFETIME_KWH: decoded_data.get("total_pv_power_generation"),
-            StandardDataKeys.ENERGY_LOAD_TOTAL_KWH: decoded_data.get("total_load_power_consumption"),
+            StandardDataKeys.ENERGY_PV_TOTAL_LIFETIME_KWH: get("total_pv_power_generation"),
+            StandardDataKeys.ENERGY_LOAD_TOTAL_KWH: get("total_load_power_consumption"),
             "raw_values": decoded_data
         }
\ No newline at end of file
@@ -99,12 +99,12 @@ class VoltronicPiPlugin(DevicePlugin):
                 if serial is None:
                     raise ImportError("pyserial required for Voltronic serial")
                 self._io = serial.Serial(self.serial_port, self.baud_rate, timeout=self.timeout)
-            self._is_connected_flag = True
+            self.is_connected = True
             return True
         except Exception as e:
             self.last_error_message = str(e)
             self.logger.error("Voltronic connect failed: %s", e)
-            self._is_connected_flag = False
+            self.is_connected = False
             return False
 
     def disconnect(self) -> None:
@@ -114,7 +114,7 @@ class VoltronicPiPlugin(DevicePlugin):
             except Exception:
                 pass
         self._io = None
-        self._is_connected_flag = False
+        self.is_connected = False
 
     def _xfer(self, cmd: str) -> bytes:
         packet = build_command(cmd)
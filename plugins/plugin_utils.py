@@ -7,7 +7,7 @@ plugins before opening Modbus/serial protocol sessions.
 
 Features:
 - TCP port reachability check with latency measurement
-- ICMP ping helper across Windows/Linux/macOS
+- ICMP ping helper across Windows/Linux/macOS (in-process socket, `ping` fallback)
 - Optional logger injection for debug diagnostics
 
 Supported Consumers:
@@ -17,14 +17,45 @@ GitHub Project: https://github.com/jcvsite/solar-monitoring
 License: MIT
 """
 
+import os
 import time
+import select
 import socket
+import struct
 import platform
 import subprocess
 import re
 import logging
+from functools import lru_cache
 from typing import Tuple, Optional
 
+# Resolved once at import; the host OS does not change while we run.
+_IS_WINDOWS = platform.system().lower() == 'windows'
+_PING_COUNT_FLAG = '-n' if _IS_WINDOWS else '-c'
+_PING_TIMEOUT_FLAG = '-w' if _IS_WINDOWS else '-W'
+
+# Ping output parsers (Windows summary, Linux/macOS summary, per-reply fallback).
+# They run on the raw bytes from the pipe; output is only decoded when returned.
+_PING_WIN_AVG_RE = re.compile(rb"Average = (\d+)ms")
+_PING_NIX_SUMMARY_RE = re.compile(rb"rtt min/avg/max/mdev = [\d.]+/([\d.]+)")
+_PING_NIX_LINE_RE = re.compile(rb"time=([\d.]+) ms")
+
+_ICMP_ECHO_REQUEST = 8
+_ICMP_ECHO_REPLY = 0
+_ICMP_PAYLOAD = b"solar-monitoring"
+
+@lru_cache(maxsize=256)
+def _cached_addrinfo(host: str, port: int) -> tuple:
+    """
+    Resolves host:port for TCP once and reuses the result on later probes.
+
+    Device addresses are effectively static, so re-running getaddrinfo (and a
+    DNS query for hostnames) on every pre-connection check is wasted work.
+    check_tcp_port clears this cache whenever a probe fails, so a device that
+    moved is re-resolved on the next attempt.
+    """
+    return tuple(socket.getaddrinfo(host, port, type=socket.SOCK_STREAM))
+
 def check_tcp_port(host: str, port: int, timeout: float = 2.0, logger_instance: Optional[logging.Logger] = None) -> Tuple[bool, float, Optional[str]]:
     """
     Checks if a TCP port is open on a given host by attempting a connection.
@@ -47,31 +78,122 @@ def check_tcp_port(host: str, port: int, timeout: float = 2.0, logger_instance:
         - Optional[str]: An error message if the connection failed, otherwise None.
     """
     effective_logger = logger_instance if logger_instance else logging.getLogger(__name__)
-    effective_logger.debug(f"TCP Check (util): Attempting to connect to {host}:{port} with timeout {timeout}s")
+    effective_logger.debug("TCP Check (util): Attempting to connect to %s:%s with timeout %ss", host, port, timeout)
     start_time = time.monotonic()
     try:
-        with socket.create_connection((host, port), timeout=timeout) as sock:
-            end_time = time.monotonic()
-            latency_ms = (end_time - start_time) * 1000
-            effective_logger.debug(f"TCP Check (util): {host}:{port} success. Latency: {latency_ms:.2f} ms")
-            return True, latency_ms, None
+        last_error: Optional[BaseException] = None
+        for family, sock_type, proto, _, sockaddr in _cached_addrinfo(host, port):
+            sock = socket.socket(family, sock_type, proto)
+            try:
+                sock.settimeout(timeout)
+                sock.connect(sockaddr)
+                end_time = time.monotonic()
+                latency_ms = (end_time - start_time) * 1000
+                effective_logger.debug("TCP Check (util): %s:%s success. Latency: %.2f ms", host, port, latency_ms)
+                return True, latency_ms, None
+            except socket.error as e:
+                last_error = e
+            finally:
+                sock.close()
+        raise last_error or socket.error(f"getaddrinfo returned no addresses for {host}")
     except socket.timeout:
-        effective_logger.debug(f"TCP Check (util): {host}:{port} timeout.")
+        _cached_addrinfo.cache_clear()
+        effective_logger.debug("TCP Check (util): %s:%s timeout.", host, port)
         return False, -1.0, "Timeout"
     except socket.error as e:
-        effective_logger.debug(f"TCP Check (util): {host}:{port} socket error: {e}")
+        _cached_addrinfo.cache_clear()
+        effective_logger.debug("TCP Check (util): %s:%s socket error: %s", host, port, e)
         return False, -1.0, str(e)
     except Exception as e_unexp:
-        effective_logger.debug(f"TCP Check (util): {host}:{port} unexpected error: {e_unexp}")
+        _cached_addrinfo.cache_clear()
+        effective_logger.debug("TCP Check (util): %s:%s unexpected error: %s", host, port, e_unexp)
         return False, -1.0, f"Unexpected: {str(e_unexp)}"
 
+def _icmp_checksum(data: bytes) -> int:
+    """Computes the RFC 1071 ones'-complement checksum used by ICMP."""
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+def _build_icmp_echo(ident: int, seq: int) -> bytes:
+    """Builds an ICMP echo request packet with a valid checksum."""
+    header = struct.pack("!BBHHH", _ICMP_ECHO_REQUEST, 0, 0, ident, seq)
+    checksum = _icmp_checksum(header + _ICMP_PAYLOAD)
+    return struct.pack("!BBHHH", _ICMP_ECHO_REQUEST, 0, checksum, ident, seq) + _ICMP_PAYLOAD
+
+def _open_icmp_socket() -> Optional[socket.socket]:
+    """
+    Opens an ICMP socket without spawning a process.
+
+    Tries an unprivileged datagram ICMP socket first (Linux with a permissive
+    net.ipv4.ping_group_range, macOS), then a raw socket (root/CAP_NET_RAW).
+    Returns None when neither is permitted so the caller can fall back.
+    """
+    for sock_type in (socket.SOCK_DGRAM, socket.SOCK_RAW):
+        try:
+            return socket.socket(socket.AF_INET, sock_type, socket.IPPROTO_ICMP)
+        except (OSError, AttributeError):
+            continue
+    return None
+
+def _ping_socket(host: str, count: int, timeout_s: float) -> Optional[Tuple[bool, float, Optional[str]]]:
+    """
+    Sends ICMP echo requests from an in-process socket and times the replies.
+
+    Returns the same tuple as check_icmp_ping, or None if ICMP sockets are not
+    available to this process or the host has no IPv4 address (e.g. an IPv6
+    literal); the caller then uses the system `ping`, which handles both.
+    """
+    try:
+        addr = socket.getaddrinfo(host, None, socket.AF_INET)[0][4][0]
+    except (socket.gaierror, IndexError):
+        return None
+    sock = _open_icmp_socket()
+    if sock is None:
+        return None
+    try:
+        ident = os.getpid() & 0xFFFF
+        latencies = []
+        for seq in range(1, count + 1):
+            start = time.monotonic()
+            deadline = start + timeout_s
+            sock.sendto(_build_icmp_echo(ident, seq), (addr, 0))
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not select.select([sock], [], [], remaining)[0]:
+                    break
+                packet, (reply_addr, _) = sock.recvfrom(1024)
+                if packet and packet[0] >> 4 == 4:  # raw sockets (and macOS DGRAM) include the IPv4 header
+                    packet = packet[(packet[0] & 0x0F) * 4:]
+                if len(packet) < 8 or reply_addr != addr:
+                    continue
+                icmp_type, _, _, reply_ident, reply_seq = struct.unpack("!BBHHH", packet[:8])
+                # Datagram sockets rewrite the identifier; raw sockets see every ICMP packet on the host.
+                if sock.type == socket.SOCK_RAW and reply_ident != ident:
+                    continue
+                if icmp_type == _ICMP_ECHO_REPLY and reply_seq == seq:
+                    latencies.append((time.monotonic() - start) * 1000)
+                    break
+        if not latencies:
+            return False, -1.0, f"No ICMP echo reply from {host} within {timeout_s}s."
+        return True, sum(latencies) / len(latencies), f"{len(latencies)}/{count} replies from {addr}"
+    except Exception as e:
+        return False, -1.0, f"Ping exception: {e}"
+    finally:
+        sock.close()
+
 def check_icmp_ping(host: str, count: int = 1, timeout_s: int = 1, logger_instance: Optional[logging.Logger] = None) -> Tuple[bool, float, Optional[str]]:
     """
     Performs an ICMP ping to a host to check for reachability and latency.
 
-    This function uses the system's native `ping` command, making it a reliable
-    way to check basic network reachability. It adapts its command-line arguments
-    for both Windows and Unix-like systems (Linux, macOS).
+    ICMP echo requests are sent from an in-process socket when the OS allows it
+    (unprivileged ICMP datagram sockets or CAP_NET_RAW), avoiding a process
+    spawn and text parsing per check. Otherwise it falls back to the system's
+    native `ping` command, adapting its arguments for both Windows and
+    Unix-like systems (Linux, macOS).
 
     Args:
         host (str): The hostname or IP address to ping.
@@ -88,45 +210,46 @@ def check_icmp_ping(host: str, count: int = 1, timeout_s: int = 1, logger_instan
         - Optional[str]: The raw output from the ping command or an error message.
     """
     effective_logger = logger_instance if logger_instance else logging.getLogger(__name__)
-    effective_logger.debug(f"ICMP Check (util): Pinging {host} (count={count}, timeout={timeout_s}s)")
-    param = '-n' if platform.system().lower() == 'windows' else '-c'
-    timeout_param_flag = '-w' if platform.system().lower() == 'windows' else '-W' 
-    ping_timeout_value = timeout_s * 1000 if platform.system().lower() == 'windows' else timeout_s
-    command = ['ping', param, str(count), timeout_param_flag, str(ping_timeout_value), host]
-    raw_output = ""
+    effective_logger.debug("ICMP Check (util): Pinging %s (count=%s, timeout=%ss)", host, count, timeout_s)
+    socket_result = _ping_socket(host, count, timeout_s)
+    if socket_result is not None:
+        effective_logger.debug("ICMP Check (util): %s in-process result: %s", host, socket_result)
+        return socket_result
+    ping_timeout_value = timeout_s * 1000 if _IS_WINDOWS else timeout_s
+    command = ['ping', _PING_COUNT_FLAG, str(count), _PING_TIMEOUT_FLAG, str(ping_timeout_value), host]
     try:
         # Prevent console window from appearing on Windows
         startupinfo = None
-        if platform.system().lower() == 'windows':
+        if _IS_WINDOWS:
             startupinfo = subprocess.STARTUPINFO()
             startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
             startupinfo.wShowWindow = subprocess.SW_HIDE
 
-        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, startupinfo=startupinfo)
-        stdout, stderr = process.communicate(timeout=timeout_s + 2) 
-        raw_output = stdout + stderr
+        process = subprocess.run(command, capture_output=True, timeout=timeout_s + 2, startupinfo=startupinfo)
+        stdout = process.stdout
 
         if process.returncode == 0 and stdout:
             avg_latency = -1.0; latencies = []
-            if platform.system().lower() == 'windows':
-                match = re.search(r"Average = (\d+)ms", stdout)
+            if _IS_WINDOWS:
+                match = _PING_WIN_AVG_RE.search(stdout)
                 if match: latencies.append(float(match.group(1)))
             else: 
                 # More robust regex for Linux/macOS
-                summary_match = re.search(r"rtt min/avg/max/mdev = [\d.]+/([\d.]+)", stdout)
+                summary_match = _PING_NIX_SUMMARY_RE.search(stdout)
                 if summary_match:
                     latencies.append(float(summary_match.group(1)))
                 else: # Fallback for line-by-line parsing
-                    for line_match in re.finditer(r"time=([\d.]+) ms", stdout):
+                    for line_match in _PING_NIX_LINE_RE.finditer(stdout):
                         latencies.append(float(line_match.group(1)))
             
             if latencies:
                 avg_latency = sum(latencies) / len(latencies)
-                effective_logger.debug(f"ICMP Check (util): {host} success. Avg Latency: {avg_latency:.2f} ms.")
-                return True, avg_latency, raw_output.strip()
+                effective_logger.debug("ICMP Check (util): %s success. Avg Latency: %.2f ms.", host, avg_latency)
+                return True, avg_latency, stdout.strip().decode("ascii", "replace")
             else: 
                 return True, -1.0, f"Success (exit 0), latency parsing failed."
         else:
-            return False, -1.0, f"Exit code {process.returncode}. Output: {raw_output.strip()}"
+            raw_output = (stdout + process.stderr).strip().decode("ascii", "replace")
+            return False, -1.0, f"Exit code {process.returncode}. Output: {raw_output}"
     except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
         return False, -1.0, f"Ping exception: {e}"
\ No newline at end of file
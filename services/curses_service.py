@@ -16,12 +16,17 @@ GitHub Project: https://github.com/jcvsite/solar-monitoring
 License: MIT
 """
 
-import curses
+try:
+    import curses
+except ImportError:  # e.g. Windows without the windows-curses package
+    curses = None
 import logging
+import sys
 import time
-import copy
 import threading
 import re
+from bisect import bisect_right
+from functools import lru_cache
 from datetime import datetime
 from typing import Tuple, Any, Dict
 
@@ -34,6 +39,34 @@ from utils.helpers import (
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=512)
+def _format_value_memo(value: Any, precision: int) -> str:
+    return format_value(value, precision)
+
+
+def _format_cached(value: Any, precision: int) -> str:
+    """format_value() memoized per (value, precision); labels and slow-moving readings repeat every tick."""
+    try:
+        return _format_value_memo(value, precision)
+    except TypeError:  # unhashable values (lists/dicts) are formatted directly
+        return format_value(value, precision)
+
+
+@lru_cache(maxsize=256)
+def _label_prefix(label: str, width: int) -> str:
+    """Returns the padded "Label      :" column text; labels and widths are fixed per layout."""
+    return f"{label:<{width}}:"
+
+
+_CELL_NUM_RE = re.compile(r'\d+')
+
+
+@lru_cache(maxsize=32)
+def _balancing_cell_numbers(balancing_text: str) -> frozenset:
+    """Cell numbers named in the BMS balancing text; the text rarely changes between frames."""
+    return frozenset(_CELL_NUM_RE.findall(balancing_text))
+
 # Color Pair Definitions
 COLOR_PAIR_DEFAULT = 1
 COLOR_PAIR_GREEN = 2
@@ -51,6 +84,55 @@ COLOR_PAIR_BG_CRITICAL_LOW = 23
 COLOR_PAIR_BG_CRITICAL_HIGH = 24
 COLOR_PAIR_BG_DEFAULT = 13
 
+# SGR reset + clear screen + cursor home, written directly instead of shelling out
+# to `reset`/`tput sgr0`/`cls` (a fork+exec, and `reset` alone takes ~1s on Linux)
+TERMINAL_RESET_SEQUENCE = "\x1b[0m\x1b[2J\x1b[H"
+TERMINAL_SGR_RESET = "\x1b[0m"
+
+# Keys tested for every BMS value drawn, bound once at import
+_KEY_CELL_VOLTAGE_DELTA = StandardDataKeys.BMS_CELL_VOLTAGE_DELTA_VOLTS
+_KEY_STATE_OF_HEALTH = StandardDataKeys.BATTERY_STATE_OF_HEALTH_PERCENT
+_BMS_CELL_PREFIX = StandardDataKeys.BMS_CELL_VOLTAGES_LIST
+
+# Stand-in for a missing data entry in _add_std (only ever read)
+_NO_ENTRY: Dict[str, Any] = {}
+
+# Fixed (key, label[, precision, unit]) rows of the data columns
+_ENERGY_ROWS = (
+    (StandardDataKeys.ENERGY_PV_DAILY_KWH, "PV Yield"),
+    (StandardDataKeys.ENERGY_GRID_DAILY_IMPORT_KWH, "GridImport"),
+    (StandardDataKeys.ENERGY_GRID_DAILY_EXPORT_KWH, "GridExport"),
+    (StandardDataKeys.ENERGY_LOAD_DAILY_KWH, "LoadCons"),
+)
+_BMS_V_ROWS = (
+    (StandardDataKeys.BMS_CELL_VOLTAGE_MIN_VOLTS, "Cell V Min", 3, "V"),
+    (StandardDataKeys.BMS_CELL_VOLTAGE_MAX_VOLTS, "Cell V Max", 3, "V"),
+    (StandardDataKeys.BMS_CELL_VOLTAGE_DELTA_VOLTS, "Cell V Diff", 3, "V"),
+)
+_GRID_ROWS = (
+    (StandardDataKeys.GRID_TOTAL_ACTIVE_POWER_WATTS, "Grid Power", 0, "W"),
+    (StandardDataKeys.GRID_L1_VOLTAGE_VOLTS, "Grid Volt", 1, "V"),
+    (StandardDataKeys.LOAD_TOTAL_POWER_WATTS, "Load Power", 0, "W"),
+)
+
+# Status keyword classes for _get_color_attr, tested in priority order (red beats green beats yellow).
+# One alternation per class rather than a combined pattern, whose leftmost match would ignore priority.
+_STATUS_RED_RE = re.compile(r"fault|fail|stop|error|alarm|protection")
+_STATUS_GREEN_RE = re.compile(r"generating|on|connected|discharging|exporting|ok|good|active")
+_STATUS_YELLOW_RE = re.compile(r"wait|standby|idle|warning")
+_STATUS_DISABLED = TUYA_STATE_DISABLED.lower()
+
+# Upper bound for the status-text -> color attribute memo (numeric readings also pass through it)
+_STATUS_ATTR_CACHE_MAX = 256
+
+# Every pair the dashboard draws with (cached as attributes after initialization)
+_COLOR_PAIR_IDS = (
+    COLOR_PAIR_DEFAULT, COLOR_PAIR_GREEN, COLOR_PAIR_YELLOW, COLOR_PAIR_RED,
+    COLOR_PAIR_BLUE, COLOR_PAIR_ORANGE, COLOR_PAIR_GREY,
+    COLOR_PAIR_BG_NORMAL, COLOR_PAIR_BG_LOW_WARN, COLOR_PAIR_BG_HIGH_WARN,
+    COLOR_PAIR_BG_CRITICAL_LOW, COLOR_PAIR_BG_CRITICAL_HIGH,
+)
+
 class CursesService:
     """Manages a real-time text-based console dashboard using curses.
 
@@ -59,17 +141,48 @@ class CursesService:
     """
     ANSI_ESCAPE_PATTERN = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
 
+    # (pair_id, foreground, background) for every fixed color pair. -1 keeps the
+    # terminal's default background. Grey is set up separately by
+    # _init_grey_color_safe because its color depends on the palette size.
+    _ALL_PAIRS: Tuple[Tuple[int, int, int], ...] = () if curses is None else (
+        (COLOR_PAIR_DEFAULT, curses.COLOR_WHITE, -1),
+        (COLOR_PAIR_GREEN, curses.COLOR_GREEN, -1),
+        (COLOR_PAIR_YELLOW, curses.COLOR_YELLOW, -1),
+        (COLOR_PAIR_RED, curses.COLOR_RED, -1),
+        (COLOR_PAIR_BLUE, curses.COLOR_CYAN, -1),
+        (COLOR_PAIR_ORANGE, curses.COLOR_MAGENTA, -1),
+        (COLOR_PAIR_BG_NORMAL, curses.COLOR_BLACK, curses.COLOR_GREEN),
+        (COLOR_PAIR_BG_LOW_WARN, curses.COLOR_BLACK, curses.COLOR_YELLOW),
+        (COLOR_PAIR_BG_HIGH_WARN, curses.COLOR_BLACK, curses.COLOR_YELLOW),
+        (COLOR_PAIR_BG_CRITICAL_LOW, curses.COLOR_WHITE, curses.COLOR_RED),
+        (COLOR_PAIR_BG_CRITICAL_HIGH, curses.COLOR_WHITE, curses.COLOR_RED),
+    )
+
+    # BMS color bands as sorted lower bounds (inclusive) for bisect_right:
+    # bucket i covers [thresholds[i-1], thresholds[i]).
+    _CELL_THRESHOLDS = (2.80, 3.15, 3.55, 3.65)
+    _CELL_BG_BY_BUCKET = (
+        COLOR_PAIR_BG_CRITICAL_LOW, COLOR_PAIR_BG_LOW_WARN, COLOR_PAIR_BG_NORMAL,
+        COLOR_PAIR_BG_HIGH_WARN, COLOR_PAIR_BG_CRITICAL_HIGH,
+    )
+    _DELTA_THRESHOLDS = (0.010, 0.030)
+    _DELTA_TEXT_BY_BUCKET = (COLOR_PAIR_GREEN, COLOR_PAIR_ORANGE, COLOR_PAIR_RED)
+
     def __init__(self, app_state: AppState):
         self.app_state = app_state
         self.enabled = app_state.config.getboolean('CONSOLE_DASHBOARD', 'ENABLE_DASHBOARD', fallback=True)
         self.update_interval = app_state.config.getint('CONSOLE_DASHBOARD', 'DASHBOARD_UPDATE_INTERVAL', fallback=1)
         self.font_scale = str(app_state.config.get('CONSOLE_DASHBOARD', 'FONT_SCALE', fallback='normal')).strip().lower()
         self.stdscr = None
-        self.curses_available = False
-        try:
-            import curses
-            self.curses_available = True
-        except ImportError:
+        self._color_attr_cache: Dict[int, int] = {}
+        self._status_attr_cache: Dict[str, int] = {}
+        self._pair_attr: Dict[Tuple[int, int], int] = {}
+        self._snapshot_buf: Dict[str, Dict[str, Any]] = {}
+        self._snapshot_version = -1
+        self._cur_maxyx: Tuple[int, int] = (0, 0)  # screen size of the frame being drawn
+        self._last_frame_inputs: Tuple | None = None
+        self.curses_available = curses is not None
+        if not self.curses_available:
             logger.warning("Curses library not found, console dashboard disabled.")
             self.enabled = False
 
@@ -125,16 +238,11 @@ class CursesService:
             # Restore ALL color pairs - both text and BMS background colors
             self._init_safe_colors()
             
-            # Explicitly verify that text colors are working
-            self._verify_text_colors()
-            
-            # Double-check BMS colors specifically (since they were the main issue)
-            self._ensure_bms_colors()
-            
             # Force a complete screen refresh to apply all color changes
             if self.stdscr:
                 self.stdscr.clear()
                 self.stdscr.refresh()
+                self._last_frame_inputs = None  # screen was wiped: next frame is drawn in full
             
             logger.info("Complete color preservation completed successfully")
             
@@ -146,17 +254,20 @@ class CursesService:
     def _emergency_terminal_reset(self) -> None:
         """Emergency terminal reset when curses is not available."""
         try:
-            import os
-            if os.name == 'nt':  # Windows
-                os.system('cls')
-                os.system('color 07')  # Reset to white on black
-            else:  # Unix/Linux
-                os.system('reset')
-                os.system('tput sgr0')
+            self._write_terminal_reset(TERMINAL_RESET_SEQUENCE)
             logger.info("Emergency terminal reset completed")
         except Exception as e:
             logger.error(f"Emergency terminal reset failed: {e}")
 
+    @staticmethod
+    def _write_terminal_reset(sequence: str) -> None:
+        """Writes ANSI reset sequences to the real terminal (VT-capable consoles, incl. Windows 10+)."""
+        stream = sys.__stdout__
+        if stream is None:
+            return
+        stream.write(sequence)
+        stream.flush()
+
     def stop(self) -> None:
         """Stop the curses service and cleanup terminal state."""
         try:
@@ -182,32 +293,41 @@ class CursesService:
                 curses.cbreak()
                 self.stdscr.keypad(True)
                 curses.curs_set(0)
-                self.stdscr.nodelay(True)
                 self._init_curses_colors()
                 if self.font_scale == 'large':
                     layout = {'label_width': 10, 'col_padding': 2, 'data_start_y': 3, 'precision_bias': -1}
                 else:
                     layout = {'label_width': 12, 'col_padding': 3, 'data_start_y': 4, 'precision_bias': 0}
 
+                monotonic, doupdate = time.monotonic, curses.doupdate
+                next_draw = 0.0
+                self._last_frame_inputs = None  # fresh screen: first frame is drawn in full
                 while self.app_state.running:
-                    loop_start = time.monotonic()
-                    
+                    # getch() blocks until a key arrives or the next frame is due, so the
+                    # loop paces itself and 'q'/resize are handled immediately.
+                    self.stdscr.timeout(max(0, int((next_draw - monotonic()) * 1000)))
                     input_result = self._handle_input()
                     if input_result == 'quit':
                         self.app_state.main_threads_stop_event.set()
                         return
+                    if input_result == 'resize':
+                        self._last_frame_inputs = None
+                    elif monotonic() < next_draw:
+                        continue  # unrelated key before the frame is due
+                    next_draw = monotonic() + self.update_interval
                     
-                    with self.app_state.data_lock:
-                        data_snapshot = copy.deepcopy(self.app_state.shared_data)
+                    # Re-snapshot only when a producer has published new data since the last
+                    # frame; _draw_screen then repaints only the clock if nothing else changed.
+                    data_version = self.app_state.data_version
+                    if data_version != self._snapshot_version:
+                        self.app_state.snapshot_into(self._snapshot_buf)
+                        self._snapshot_version = data_version
+                    data_snapshot = self._snapshot_buf
                     
+                    # On KEY_RESIZE ncurses has already resized stdscr and scheduled a full
+                    # repaint, so a single erase-and-draw is enough (no clear() flash).
                     self._draw_screen(data_snapshot, layout)
-                    
-                    if input_result == 'resize':
-                        self.stdscr.clear()
-                        self._draw_screen(data_snapshot, layout)
-                    
-                    loop_duration = time.monotonic() - loop_start
-                    time.sleep(max(0, self.update_interval - loop_duration))
+                    doupdate()
             except Exception as e:
                 logger.error(f"Curses dashboard crashed: {e}", exc_info=True)
                 try:
@@ -261,159 +381,73 @@ class CursesService:
 
     def _init_safe_colors(self) -> None:
         """
-        Initialize only essential colors with maximum safety and error handling.
+        Initialize every dashboard color pair exactly once, with per-pair error handling.
         
-        This method uses the most conservative approach to prevent any color
-        corruption issues during plugin reconnections or thread restarts.
+        This is the single, idempotent place where pairs are set up: startup and all
+        color recovery paths call it once, and it then rebuilds the attribute cache.
         """
         try:
-            # Only initialize the most basic, essential color pairs
-            # Use -1 for background to maintain terminal default background
-            
-            # Essential text colors - keep it minimal
-            curses.init_pair(COLOR_PAIR_DEFAULT, curses.COLOR_WHITE, -1)
-            curses.init_pair(COLOR_PAIR_GREEN, curses.COLOR_GREEN, -1)
-            curses.init_pair(COLOR_PAIR_YELLOW, curses.COLOR_YELLOW, -1)
-            curses.init_pair(COLOR_PAIR_RED, curses.COLOR_RED, -1)
-            curses.init_pair(COLOR_PAIR_BLUE, curses.COLOR_CYAN, -1)
-            curses.init_pair(COLOR_PAIR_ORANGE, curses.COLOR_MAGENTA, -1)
+            # Each pair is initialized individually so one failure cannot skip the rest
+            for pair_id, fg_color, bg_color in self._ALL_PAIRS:
+                self._init_color_pair(pair_id, fg_color, bg_color)
             
             # Grey color for disabled status - use a visible approach
             self._init_grey_color_safe()
             
-            # BMS background colors - ROBUST initialization with error handling
-            # Each color pair is initialized individually with fallback
-            self._init_bms_color_pair(COLOR_PAIR_BG_NORMAL, curses.COLOR_BLACK, curses.COLOR_GREEN)
-            self._init_bms_color_pair(COLOR_PAIR_BG_LOW_WARN, curses.COLOR_BLACK, curses.COLOR_YELLOW)
-            self._init_bms_color_pair(COLOR_PAIR_BG_HIGH_WARN, curses.COLOR_BLACK, curses.COLOR_YELLOW)
-            self._init_bms_color_pair(COLOR_PAIR_BG_CRITICAL_LOW, curses.COLOR_WHITE, curses.COLOR_RED)
-            self._init_bms_color_pair(COLOR_PAIR_BG_CRITICAL_HIGH, curses.COLOR_WHITE, curses.COLOR_RED)
-            
             logger.debug("Safe colors initialized successfully")
             
-        except curses.error as e:
-            logger.warning(f"Safe color initialization failed: {e}")
-            # If even safe colors fail, the system will work in monochrome
         except Exception as e:
             logger.error(f"Unexpected error in safe color initialization: {e}")
+        finally:
+            self._rebuild_color_attr_cache()
 
-    def _init_bms_color_pair(self, pair_id: int, fg_color: int, bg_color: int) -> None:
+    def _rebuild_color_attr_cache(self) -> None:
         """
-        Initialize a single BMS background color pair with robust error handling.
+        Precomputes curses.color_pair() for every pair the dashboard draws with.
+
+        Runs after each (re)initialization of the pairs, so the per-cell draw path
+        is a dict lookup instead of a C call wrapped in try/except.
+        """
+        cache: Dict[int, int] = {}
+        for pair_id in _COLOR_PAIR_IDS:
+            try:
+                cache[pair_id] = curses.color_pair(pair_id)
+            except curses.error:
+                cache[pair_id] = cache.get(COLOR_PAIR_DEFAULT, 0)
+        self._color_attr_cache = cache
+        # The (pair, extra attribute) combinations _get_color_attr classifies statuses into
+        bold = curses.A_BOLD
+        self._pair_attr = {
+            (COLOR_PAIR_DEFAULT, 0): cache[COLOR_PAIR_DEFAULT],
+            (COLOR_PAIR_RED, bold): cache[COLOR_PAIR_RED] | bold,
+            (COLOR_PAIR_GREEN, 0): cache[COLOR_PAIR_GREEN],
+            (COLOR_PAIR_YELLOW, 0): cache[COLOR_PAIR_YELLOW],
+            (COLOR_PAIR_GREY, 0): cache[COLOR_PAIR_GREY],
+        }
+        self._status_attr_cache.clear()  # memoized status colors embed the old attributes
+
+    def _init_color_pair(self, pair_id: int, fg_color: int, bg_color: int) -> None:
+        """
+        Initialize a single color pair with robust error handling.
         
-        This method ensures that BMS background colors are properly initialized
-        and maintained even during color recovery operations.
+        Background pairs (BMS cells) fall back to the default background if the
+        terminal rejects the requested one.
         """
         try:
             curses.init_pair(pair_id, fg_color, bg_color)
-            logger.debug(f"BMS color pair {pair_id} initialized successfully")
+            logger.debug("Color pair %s initialized successfully", pair_id)
         except curses.error as e:
-            logger.warning(f"Failed to initialize BMS color pair {pair_id}: {e}")
+            logger.warning(f"Failed to initialize color pair {pair_id}: {e}")
+            if bg_color == -1:
+                return
             # Fallback: try with default background
             try:
                 curses.init_pair(pair_id, fg_color, -1)
-                logger.debug(f"BMS color pair {pair_id} initialized with default background")
+                logger.debug("Color pair %s initialized with default background", pair_id)
             except curses.error:
-                logger.warning(f"Complete failure to initialize BMS color pair {pair_id}")
-        except Exception as e:
-            logger.error(f"Unexpected error initializing BMS color pair {pair_id}: {e}")
-
-    def _ensure_bms_colors(self) -> None:
-        """
-        Ensure BMS background colors are properly initialized after color reset.
-        
-        This method is called after aggressive color reset to make sure
-        BMS cell background colors are working correctly.
-        """
-        try:
-            logger.debug("Ensuring BMS background colors are properly initialized...")
-            
-            # Re-initialize all BMS background color pairs with extra verification
-            bms_color_pairs = [
-                (COLOR_PAIR_BG_NORMAL, curses.COLOR_BLACK, curses.COLOR_GREEN),
-                (COLOR_PAIR_BG_LOW_WARN, curses.COLOR_BLACK, curses.COLOR_YELLOW),
-                (COLOR_PAIR_BG_HIGH_WARN, curses.COLOR_BLACK, curses.COLOR_YELLOW),
-                (COLOR_PAIR_BG_CRITICAL_LOW, curses.COLOR_WHITE, curses.COLOR_RED),
-                (COLOR_PAIR_BG_CRITICAL_HIGH, curses.COLOR_WHITE, curses.COLOR_RED)
-            ]
-            
-            for pair_id, fg, bg in bms_color_pairs:
-                try:
-                    # Initialize the color pair
-                    curses.init_pair(pair_id, fg, bg)
-                    
-                    # Test that it works by getting the color pair
-                    test_attr = curses.color_pair(pair_id)
-                    if test_attr == 0:
-                        logger.warning(f"BMS color pair {pair_id} returned 0 attribute")
-                    else:
-                        logger.debug(f"BMS color pair {pair_id} verified successfully")
-                        
-                except curses.error as e:
-                    logger.warning(f"Failed to ensure BMS color pair {pair_id}: {e}")
-                    # Try fallback with default background
-                    try:
-                        curses.init_pair(pair_id, fg, -1)
-                        logger.debug(f"BMS color pair {pair_id} initialized with default background fallback")
-                    except curses.error:
-                        logger.error(f"Complete failure to initialize BMS color pair {pair_id}")
-            
-            logger.debug("BMS color verification completed")
-            
-        except Exception as e:
-            logger.error(f"Error ensuring BMS colors: {e}")
-
-    def _verify_text_colors(self) -> None:
-        """
-        Verify that text colors are properly initialized and working.
-        
-        This method ensures that regular text colors (green, red, yellow, etc.)
-        are working correctly after color recovery operations.
-        """
-        try:
-            logger.debug("Verifying text colors are properly initialized...")
-            
-            # Re-initialize and verify all text color pairs (except grey - handle separately)
-            text_color_pairs = [
-                (COLOR_PAIR_DEFAULT, curses.COLOR_WHITE, -1),
-                (COLOR_PAIR_GREEN, curses.COLOR_GREEN, -1),
-                (COLOR_PAIR_YELLOW, curses.COLOR_YELLOW, -1),
-                (COLOR_PAIR_RED, curses.COLOR_RED, -1),
-                (COLOR_PAIR_BLUE, curses.COLOR_CYAN, -1),
-                (COLOR_PAIR_ORANGE, curses.COLOR_MAGENTA, -1)
-            ]
-            
-            for pair_id, fg, bg in text_color_pairs:
-                try:
-                    # Initialize the color pair
-                    curses.init_pair(pair_id, fg, bg)
-                    
-                    # Test that it works by getting the color pair
-                    test_attr = curses.color_pair(pair_id)
-                    if test_attr == 0:
-                        logger.warning(f"Text color pair {pair_id} returned 0 attribute")
-                    else:
-                        logger.debug(f"Text color pair {pair_id} verified successfully")
-                        
-                except curses.error as e:
-                    logger.warning(f"Failed to verify text color pair {pair_id}: {e}")
-            
-            # Handle grey color separately using the safe initialization method
-            try:
-                self._init_grey_color_safe()
-                # Test that grey color works
-                test_attr = curses.color_pair(COLOR_PAIR_GREY)
-                if test_attr == 0:
-                    logger.warning("Grey color pair returned 0 attribute after safe initialization")
-                else:
-                    logger.debug("Grey color pair verified successfully after safe initialization")
-            except Exception as e:
-                logger.warning(f"Failed to verify grey color pair with safe method: {e}")
-            
-            logger.debug("Text color verification completed")
-            
+                logger.warning(f"Complete failure to initialize color pair {pair_id}")
         except Exception as e:
-            logger.error(f"Error verifying text colors: {e}")
+            logger.error(f"Unexpected error initializing color pair {pair_id}: {e}")
 
     def _init_grey_color(self) -> None:
         """
@@ -540,33 +574,21 @@ class CursesService:
         try:
             logger.info("Performing aggressive color reset...")
             
-            # Step 1: Reset all color pairs to default
-            if curses.has_colors():
-                try:
-                    for i in range(1, min(curses.COLOR_PAIRS, 64)):
-                        try:
-                            curses.init_pair(i, curses.COLOR_WHITE, -1)
-                        except curses.error:
-                            break
-                except curses.error:
-                    pass
-            
-            # Step 2: Reinitialize color system
+            # Step 1: Reinitialize color system
             try:
                 curses.start_color()
                 curses.use_default_colors()
             except curses.error:
                 pass
             
-            # Step 3: Reinitialize our color pairs with extra emphasis on BMS colors
+            # Step 2: Reinitialize our color pairs (text and BMS backgrounds). This is
+            # authoritative for every pair we use, so other pair IDs are left alone.
             self._init_safe_colors()
             
-            # Step 4: Double-check BMS background colors are properly initialized
-            self._ensure_bms_colors()
-            
-            # Step 5: Clear and refresh screen to apply changes
+            # Step 3: Clear and refresh screen to apply changes
             self.stdscr.clear()
             self.stdscr.refresh()
+            self._last_frame_inputs = None  # screen was wiped: next frame is drawn in full
             
             logger.info("Aggressive color reset completed successfully")
             
@@ -574,11 +596,7 @@ class CursesService:
             logger.error(f"Aggressive color reset failed: {e}")
             # Last resort: try terminal reset
             try:
-                import os
-                if os.name == 'nt':
-                    os.system('color')  # Reset Windows console colors
-                else:
-                    os.system('tput sgr0')  # Reset Unix terminal attributes
+                self._write_terminal_reset(TERMINAL_SGR_RESET)
             except:
                 pass
 
@@ -590,76 +608,45 @@ class CursesService:
         color degradation without disrupting the display.
         """
         try:
-            # Just reinitialize the most critical color pairs
-            essential_pairs = [
-                (COLOR_PAIR_GREEN, curses.COLOR_GREEN, -1),
-                (COLOR_PAIR_RED, curses.COLOR_RED, -1),
-                (COLOR_PAIR_YELLOW, curses.COLOR_YELLOW, -1),
-                (COLOR_PAIR_DEFAULT, curses.COLOR_WHITE, -1)
-            ]
-            
-            for pair_id, fg, bg in essential_pairs:
+            # Same pair table as _init_safe_colors, without per-pair logging or fallbacks
+            for pair_id, fg, bg in self._ALL_PAIRS:
                 try:
                     curses.init_pair(pair_id, fg, bg)
                 except curses.error:
                     pass  # Ignore errors in lightweight refresh
                     
         except Exception as e:
-            logger.debug(f"Lightweight color refresh failed: {e}")
+            logger.debug("Lightweight color refresh failed: %s", e)
 
     def _get_bms_color_attr(self, key: str, value: Any, background: bool = False) -> int:
         """
-        Returns curses color attribute for BMS data with proper error handling.
+        Returns curses color attribute for BMS data.
         
-        This method prevents color corruption by safely handling color pair
-        operations and providing fallbacks when color operations fail.
+        Only numeric comparisons and cached color pair lookups happen here, so
+        nothing can raise and no try/except is needed per drawn cell.
         """
         if not isinstance(value, (int, float)):
             return self._get_color_attr(value)
 
         text_pair, bg_pair = COLOR_PAIR_GREEN, COLOR_PAIR_BG_NORMAL
 
-        try:
-            if key == StandardDataKeys.BMS_CELL_VOLTAGE_DELTA_VOLTS:
-                text_pair = COLOR_PAIR_RED if value >= 0.030 else COLOR_PAIR_ORANGE if value >= 0.010 else text_pair
-            elif key == StandardDataKeys.BATTERY_STATE_OF_HEALTH_PERCENT:
-                text_pair = COLOR_PAIR_RED if value <= 95 else COLOR_PAIR_ORANGE if value < 100 else text_pair
-            elif key.startswith(StandardDataKeys.BMS_CELL_VOLTAGES_LIST):
-                if value >= 3.65:
-                    bg_pair = COLOR_PAIR_BG_CRITICAL_HIGH
-                elif value >= 3.55:
-                    bg_pair = COLOR_PAIR_BG_HIGH_WARN
-                elif value >= 3.15:
-                    bg_pair = COLOR_PAIR_BG_NORMAL
-                elif value >= 2.80:
-                    bg_pair = COLOR_PAIR_BG_LOW_WARN
-                else:
-                    bg_pair = COLOR_PAIR_BG_CRITICAL_LOW
+        if key == _KEY_CELL_VOLTAGE_DELTA:
+            text_pair = self._DELTA_TEXT_BY_BUCKET[bisect_right(self._DELTA_THRESHOLDS, value)]
+        elif key == _KEY_STATE_OF_HEALTH:
+            text_pair = COLOR_PAIR_RED if value <= 95 else COLOR_PAIR_ORANGE if value < 100 else text_pair
+        elif key.startswith(_BMS_CELL_PREFIX):
+            bg_pair = self._CELL_BG_BY_BUCKET[bisect_right(self._CELL_THRESHOLDS, value)]
 
-            # Safely get color pair with error handling
-            target_pair = bg_pair if background else text_pair
-            return self._safe_color_pair(target_pair)
-            
-        except Exception as e:
-            logger.debug(f"Error in BMS color attribute calculation: {e}")
-            return self._safe_color_pair(COLOR_PAIR_DEFAULT)
+        return self._safe_color_pair(bg_pair if background else text_pair)
 
     def _safe_color_pair(self, pair_id: int) -> int:
         """
-        Safely returns a color pair attribute with error handling.
+        Returns the cached color pair attribute, or no attributes if colors are unavailable.
         
-        This method prevents curses errors that can cause color corruption
-        by providing fallbacks when color pair operations fail.
+        The cache is rebuilt by _init_safe_colors, which every color recovery path
+        goes through, so no curses call (or curses.error) happens while drawing.
         """
-        try:
-            return curses.color_pair(pair_id)
-        except curses.error:
-            # If the requested color pair fails, fall back to default
-            try:
-                return curses.color_pair(COLOR_PAIR_DEFAULT)
-            except curses.error:
-                # If even default fails, return no attributes
-                return 0
+        return self._color_attr_cache.get(pair_id, 0)
 
     def _handle_input(self) -> str | None:
         """Handles keyboard input, returning 'quit', 'resize', or None."""
@@ -683,16 +670,12 @@ class CursesService:
                 
                 # Reset color pairs to prevent background corruption
                 if curses.has_colors():
-                    try:
-                        # Reset all color pairs to default to prevent lingering background colors
-                        curses.init_pair(1, curses.COLOR_WHITE, -1)
-                        for i in range(2, min(curses.COLOR_PAIRS, 64)):
-                            try:
-                                curses.init_pair(i, curses.COLOR_WHITE, -1)
-                            except curses.error:
-                                break
-                    except curses.error:
-                        pass
+                    # Reset only the pairs the dashboard defines to prevent lingering background colors
+                    for pair_id in _COLOR_PAIR_IDS:
+                        try:
+                            curses.init_pair(pair_id, curses.COLOR_WHITE, -1)
+                        except curses.error:
+                            break
                 
                 # Standard curses cleanup
                 curses.nocbreak()
@@ -702,22 +685,19 @@ class CursesService:
                 curses.endwin()
                 
                 # Force terminal reset to clear any lingering color state
-                import os
-                if os.name == 'nt':  # Windows
-                    os.system('cls')
-                else:  # Unix/Linux
-                    os.system('reset')
+                self._write_terminal_reset(TERMINAL_RESET_SEQUENCE)
                 
                 logger.info("Curses service cleaned up with color reset.")
             except Exception as e:
                 logger.error(f"Error during curses cleanup: {e}")
-                # Emergency cleanup - force terminal reset
+                # Emergency cleanup - leave curses mode if a step above failed before endwin(),
+                # then force terminal reset
                 try:
-                    import os
-                    if os.name == 'nt':
-                        os.system('cls')
-                    else:
-                        os.system('reset')
+                    curses.endwin()
+                except curses.error:
+                    pass  # already ended, or never started
+                try:
+                    self._write_terminal_reset(TERMINAL_RESET_SEQUENCE)
                 except:
                     pass
 
@@ -725,34 +705,58 @@ class CursesService:
         """
         Returns curses color attribute based on status string with safe error handling.
         
-        This method prevents color corruption by safely handling color pair
-        operations and providing fallbacks when color operations fail.
+        Results are memoized per status text, since the same handful of statuses
+        ("OK", "Generating", "connected", ...) is classified many times per frame.
         """
-        s_lower = str(status).lower()
+        key = status if type(status) is str else str(status)
+        cached = self._status_attr_cache.get(key)
+        if cached is not None:
+            return cached
+        s_lower = key.lower()
         pair, attr = COLOR_PAIR_DEFAULT, 0
         
         try:
-            if any(x in s_lower for x in ["fault", "fail", "stop", "error", "alarm", "protection"]):
+            if s_lower == _STATUS_DISABLED:  # matches none of the keyword classes
+                pair = COLOR_PAIR_GREY
+            elif _STATUS_RED_RE.search(s_lower):
                 pair, attr = COLOR_PAIR_RED, curses.A_BOLD
-            elif any(x in s_lower for x in ["generating", "on", "connected", "discharging", "exporting", "ok", "good", "active"]):
+            elif _STATUS_GREEN_RE.search(s_lower):
                 pair = COLOR_PAIR_GREEN
-            elif any(x in s_lower for x in ["wait", "standby", "idle", "warning"]):
+            elif _STATUS_YELLOW_RE.search(s_lower):
                 pair = COLOR_PAIR_YELLOW
-            elif s_lower == TUYA_STATE_DISABLED.lower():
-                pair = COLOR_PAIR_GREY
             
-            return self._safe_color_pair(pair) | attr
+            result = self._pair_attr.get((pair, attr))
+            if result is None:  # colors not set up yet
+                result = self._safe_color_pair(pair) | attr
+            cache = self._status_attr_cache
+            if len(cache) >= _STATUS_ATTR_CACHE_MAX:
+                del cache[next(iter(cache))]  # evict the oldest entry
+            cache[key] = result
+            return result
             
         except Exception as e:
-            logger.debug(f"Error in color attribute calculation: {e}")
+            logger.debug("Error in color attribute calculation: %s", e)
             return self._safe_color_pair(COLOR_PAIR_DEFAULT)
 
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _strip_ansi_cached(text: str) -> str:
+        """Removes ANSI escape sequences, memoized since most drawn strings repeat between frames."""
+        return CursesService.ANSI_ESCAPE_PATTERN.sub('', text)
+
+    @staticmethod
+    def _strip_ansi(text: str) -> str:
+        """Removes ANSI escape sequences; text without an ESC byte is returned as-is."""
+        return text if '\x1b' not in text else CursesService._strip_ansi_cached(text)
+
     def _add_str_safe(self, y: int, x: int, text: str, attr: int = 0) -> None:
         """Safely adds string to screen, handling boundaries."""
         try:
-            sanitized_text = self.ANSI_ESCAPE_PATTERN.sub('', str(text))
+            if type(text) is not str:
+                text = str(text)
+            sanitized_text = text if '\x1b' not in text else self._strip_ansi_cached(text)
 
-            max_y, max_x = self.stdscr.getmaxyx()
+            max_y, max_x = self._cur_maxyx
             if 0 <= y < max_y and 0 <= x < max_x:
                 # Use the sanitized text for display
                 safe_text = sanitized_text[:max_x - x - 1]
@@ -764,88 +768,95 @@ class CursesService:
                  prec: int = 1, unit_override: str | None = None, val_override: Any = None,
                  color_key_override: str | None = None, custom_color_attr: int | None = None) -> int:
         """Draws a standardized label-value line."""
-        val_dict = data.get(key, {})
+        val_dict = data.get(key, _NO_ENTRY)
         raw_value = val_override if val_override is not None else val_dict.get("value", STATUS_NA)
         is_error = isinstance(raw_value, str) and "error" in raw_value.lower()
         unit = unit_override if unit_override is not None else val_dict.get("unit", "")
         eff_prec = max(0, prec + int(layout.get('precision_bias', 0)))
-        formatted_val = raw_value if is_error else format_value(raw_value, eff_prec)
+        formatted_val = raw_value if is_error else _format_cached(raw_value, eff_prec)
 
         if unit and isinstance(unit, str) and unit not in ["Code", "TextList", "Dict"]:
             formatted_val += f" {unit}"
 
-        attr = custom_color_attr or self._get_color_attr(
-            val_override if val_override is not None else data.get(color_key_override or key, {}).get("value", raw_value)
-        )
+        if not custom_color_attr:
+            if val_override is not None:
+                color_source = val_override
+            elif color_key_override:
+                color_source = data.get(color_key_override, _NO_ENTRY).get("value", raw_value)
+            else:
+                color_source = raw_value  # already read from val_dict
+            attr = self._get_color_attr(color_source)
+        else:
+            attr = custom_color_attr
 
-        self._add_str_safe(y, x, f"{lbl:<{layout['label_width']}}:", curses.A_BOLD)
+        self._add_str_safe(y, x, _label_prefix(lbl, layout['label_width']), curses.A_BOLD)
         self._add_str_safe(y, x + layout['label_width'] + 2, str(formatted_val), attr)
         return y + 1
 
     def _draw_data_cols(self, data: Dict, layout: Dict, max_y: int, c1x: int, c2x: int, c3x: int) -> int:
         """Draws data columns for inverter, battery/BMS, and grid/system."""
         y1, y2, y3 = layout['data_start_y'], layout['data_start_y'], layout['data_start_y']
+        add, std, get = self._add_str_safe, self._add_std, data.get
+
+        def val(key: str, default: Any = None) -> Any:
+            entry = get(key)
+            return entry.get("value", default) if entry else default
 
         # Inverter Column
         has_inverter_data = StandardDataKeys.STATIC_INVERTER_MODEL_NAME in data
         if has_inverter_data:
-            inv_model = data.get(StandardDataKeys.STATIC_INVERTER_MODEL_NAME, {}).get("value", UNKNOWN)
-            self._add_str_safe(y1 - 1, c1x, f"-- INV ({inv_model}) --", curses.A_BOLD)
-            y1 = self._add_std(y1, c1x, layout, "Status", StandardDataKeys.OPERATIONAL_INVERTER_STATUS_TEXT, data)
-            y1 = self._add_std(y1, c1x, layout, "Inv Temp", StandardDataKeys.OPERATIONAL_INVERTER_TEMPERATURE_CELSIUS, data, 1, "°C")
-            y1 = self._add_std(y1, c1x, layout, "AC Power", StandardDataKeys.AC_POWER_WATTS, data, 0, "W")
-            pv_power_val = data.get(StandardDataKeys.PV_TOTAL_DC_POWER_WATTS, {}).get("value")
+            inv_model = val(StandardDataKeys.STATIC_INVERTER_MODEL_NAME, UNKNOWN)
+            add(y1 - 1, c1x, f"-- INV ({inv_model}) --", curses.A_BOLD)
+            y1 = std(y1, c1x, layout, "Status", StandardDataKeys.OPERATIONAL_INVERTER_STATUS_TEXT, data)
+            y1 = std(y1, c1x, layout, "Inv Temp", StandardDataKeys.OPERATIONAL_INVERTER_TEMPERATURE_CELSIUS, data, 1, "°C")
+            y1 = std(y1, c1x, layout, "AC Power", StandardDataKeys.AC_POWER_WATTS, data, 0, "W")
+            pv_power_val = val(StandardDataKeys.PV_TOTAL_DC_POWER_WATTS)
             pv_capacity_val = self.app_state.pv_installed_capacity_w
-            pv_power_str = f"{format_value(pv_power_val, 0)}W"
+            pv_power_str = f"{_format_cached(pv_power_val, 0)}W"
             if isinstance(pv_power_val, (int, float)) and isinstance(pv_capacity_val, (int, float)) and pv_capacity_val > 0:
                 pv_percent = (pv_power_val / pv_capacity_val) * 100
-                pv_power_str += f" ({format_value(pv_percent, 1)}%)"
-            y1 = self._add_std(y1, c1x, layout, "PV Power", StandardDataKeys.PV_TOTAL_DC_POWER_WATTS, data, 0, unit_override="", val_override=pv_power_str)
-            num_mppts = data.get(StandardDataKeys.STATIC_NUMBER_OF_MPPTS, {}).get("value", 0)
+                pv_power_str += f" ({pv_percent:.1f}%)"
+            y1 = std(y1, c1x, layout, "PV Power", StandardDataKeys.PV_TOTAL_DC_POWER_WATTS, data, 0, unit_override="", val_override=pv_power_str)
+            num_mppts = val(StandardDataKeys.STATIC_NUMBER_OF_MPPTS, 0)
             if isinstance(num_mppts, int) and num_mppts > 0:
                 for i in range(1, num_mppts + 1):
-                    v_dict = data.get(f"pv_mppt{i}_voltage_volts", {})
-                    p_dict = data.get(f"pv_mppt{i}_power_watts", {})
+                    v_dict = get(f"pv_mppt{i}_voltage_volts", {})
+                    p_dict = get(f"pv_mppt{i}_power_watts", {})
                     if v_dict and p_dict and isinstance(p_dict.get("value"), (int, float)) and p_dict["value"] > 10:
                         v, p = v_dict.get("value"), p_dict.get("value")
-                        mppt_str = f"{format_value(v, 1)}V = {format_value(p, 0)}W"
-                        y1 = self._add_std(y1, c1x + 2, layout, f"MPPT{i}", "", data, 0, val_override=mppt_str, color_key_override="generating")
+                        mppt_str = f"{_format_cached(v, 1)}V = {_format_cached(p, 0)}W"
+                        y1 = std(y1, c1x + 2, layout, f"MPPT{i}", "", data, 0, val_override=mppt_str, color_key_override="generating")
             y1 += 1
-            self._add_str_safe(y1, c1x, "-- ENERGY TODAY --", curses.A_BOLD)
+            add(y1, c1x, "-- ENERGY TODAY --", curses.A_BOLD)
             y1 += 1
-            for key, label in [
-                (StandardDataKeys.ENERGY_PV_DAILY_KWH, "PV Yield"),
-                (StandardDataKeys.ENERGY_GRID_DAILY_IMPORT_KWH, "GridImport"),
-                (StandardDataKeys.ENERGY_GRID_DAILY_EXPORT_KWH, "GridExport"),
-                (StandardDataKeys.ENERGY_LOAD_DAILY_KWH, "LoadCons")
-            ]:
-                y1 = self._add_std(y1, c1x, layout, label, key, data, 2, "kWh")
+            for key, label in _ENERGY_ROWS:
+                y1 = std(y1, c1x, layout, label, key, data, 2, "kWh")
 
         # Battery Column
         has_battery_data = StandardDataKeys.BATTERY_STATE_OF_CHARGE_PERCENT in data
         col2_start_x = c2x if has_inverter_data else c1x
         if has_battery_data:
-            bms_model = data.get(StandardDataKeys.STATIC_BATTERY_MODEL_NAME, {}).get("value", UNKNOWN)
+            bms_model = val(StandardDataKeys.STATIC_BATTERY_MODEL_NAME, UNKNOWN)
             title = f"-- BATTERY ({bms_model}) --" if bms_model != UNKNOWN else "-- BATTERY --"
-            self._add_str_safe(y2 - 1, col2_start_x, title, curses.A_BOLD)
-            soc = data.get(StandardDataKeys.BATTERY_STATE_OF_CHARGE_PERCENT, {}).get("value")
-            soh = data.get(StandardDataKeys.BATTERY_STATE_OF_HEALTH_PERCENT, {}).get("value")
-            soc_soh_str = f"{format_value(soc, 0)}%"
+            add(y2 - 1, col2_start_x, title, curses.A_BOLD)
+            soc = val(StandardDataKeys.BATTERY_STATE_OF_CHARGE_PERCENT)
+            soh = val(StandardDataKeys.BATTERY_STATE_OF_HEALTH_PERCENT)
+            soc_soh_str = f"{_format_cached(soc, 0)}%"
             soh_attr = self._get_bms_color_attr(StandardDataKeys.BATTERY_STATE_OF_HEALTH_PERCENT, soh)
             if isinstance(soh, (int, float)) and soh > 0:
-                soc_soh_str += f" / {format_value(soh, 0)}%"
-            y2 = self._add_std(y2, col2_start_x, layout, "SOC / SOH", "", data, 0, val_override=soc_soh_str, custom_color_attr=soh_attr)
-            y2 = self._add_std(y2, col2_start_x, layout, "Time Est", StandardDataKeys.OPERATIONAL_BATTERY_TIME_REMAINING_ESTIMATE_TEXT, data)
-            y2 = self._add_std(y2, col2_start_x, layout, "Batt Power", StandardDataKeys.BATTERY_POWER_WATTS, data, 0, "W", color_key_override=StandardDataKeys.BATTERY_STATUS_TEXT)
-            y2 = self._add_std(y2, col2_start_x, layout, "BattStatus", StandardDataKeys.BATTERY_STATUS_TEXT, data, 0)
-            y2 = self._add_std(y2, col2_start_x, layout, "BattChg", StandardDataKeys.ENERGY_BATTERY_DAILY_CHARGE_KWH, data, 2, "kWh")
-            y2 = self._add_std(y2, col2_start_x, layout, "BattDisChg", StandardDataKeys.ENERGY_BATTERY_DAILY_DISCHARGE_KWH, data, 2, "kWh")
-
-            packs = data.get("bms_packs_list", {}).get("value")
-            pack_count = data.get("bms_pack_count", {}).get("value")
+                soc_soh_str += f" / {soh:.0f}%"
+            y2 = std(y2, col2_start_x, layout, "SOC / SOH", "", data, 0, val_override=soc_soh_str, custom_color_attr=soh_attr)
+            y2 = std(y2, col2_start_x, layout, "Time Est", StandardDataKeys.OPERATIONAL_BATTERY_TIME_REMAINING_ESTIMATE_TEXT, data)
+            y2 = std(y2, col2_start_x, layout, "Batt Power", StandardDataKeys.BATTERY_POWER_WATTS, data, 0, "W", color_key_override=StandardDataKeys.BATTERY_STATUS_TEXT)
+            y2 = std(y2, col2_start_x, layout, "BattStatus", StandardDataKeys.BATTERY_STATUS_TEXT, data, 0)
+            y2 = std(y2, col2_start_x, layout, "BattChg", StandardDataKeys.ENERGY_BATTERY_DAILY_CHARGE_KWH, data, 2, "kWh")
+            y2 = std(y2, col2_start_x, layout, "BattDisChg", StandardDataKeys.ENERGY_BATTERY_DAILY_DISCHARGE_KWH, data, 2, "kWh")
+
+            packs = val("bms_packs_list")
+            pack_count = val("bms_pack_count")
             if isinstance(packs, list) and len(packs) > 1:
                 y2 += 1
-                self._add_str_safe(y2, col2_start_x, f"-- BMS PACKS ({pack_count}) --", curses.A_BOLD)
+                add(y2, col2_start_x, f"-- BMS PACKS ({pack_count}) --", curses.A_BOLD)
                 y2 += 1
                 for pack in packs[:6]:
                     if not isinstance(pack, dict):
@@ -853,77 +864,85 @@ class CursesService:
                     pid = str(pack.get("instance_id", "?"))[:12]
                     psoc = pack.get("soc")
                     ppwr = pack.get("power")
-                    line = f"{pid}: {format_value(psoc, 0)}% {format_value(ppwr, 0)}W"
-                    self._add_str_safe(y2, col2_start_x, line[:36])
+                    line = f"{pid}: {_format_cached(psoc, 0)}% {_format_cached(ppwr, 0)}W"
+                    add(y2, col2_start_x, line[:36])
                     y2 += 1
 
             # BMS Details
             has_bms_details = StandardDataKeys.BMS_CELL_VOLTAGE_MIN_VOLTS in data
             if has_bms_details:
                 y2 += 1
-                self._add_str_safe(y2, col2_start_x, "-- BMS STATS --", curses.A_BOLD)
+                add(y2, col2_start_x, "-- BMS STATS --", curses.A_BOLD)
                 y2 += 1
-                v_delta = data.get(StandardDataKeys.BMS_CELL_VOLTAGE_DELTA_VOLTS, {}).get("value")
+                v_delta = val(StandardDataKeys.BMS_CELL_VOLTAGE_DELTA_VOLTS)
                 v_delta_attr = self._get_bms_color_attr(StandardDataKeys.BMS_CELL_VOLTAGE_DELTA_VOLTS, v_delta)
-                for key, label, prec, unit in [
-                    (StandardDataKeys.BMS_CELL_VOLTAGE_MIN_VOLTS, "Cell V Min", 3, "V"),
-                    (StandardDataKeys.BMS_CELL_VOLTAGE_MAX_VOLTS, "Cell V Max", 3, "V"),
-                    (StandardDataKeys.BMS_CELL_VOLTAGE_DELTA_VOLTS, "Cell V Diff", 3, "V")
-                ]:
-                    y2 = self._add_std(y2, col2_start_x, layout, label, key, data, prec, unit,
-                                     custom_color_attr=v_delta_attr if key == StandardDataKeys.BMS_CELL_VOLTAGE_DELTA_VOLTS else None)
-
-                rem_cap = data.get(StandardDataKeys.BMS_REMAINING_CAPACITY_AH, {}).get("value")
-                full_cap = data.get(StandardDataKeys.BMS_FULL_CAPACITY_AH, {}).get("value")
+                for key, label, prec, unit in _BMS_V_ROWS:
+                    y2 = std(y2, col2_start_x, layout, label, key, data, prec, unit,
+                             custom_color_attr=v_delta_attr if key == StandardDataKeys.BMS_CELL_VOLTAGE_DELTA_VOLTS else None)
+
+                rem_cap = val(StandardDataKeys.BMS_REMAINING_CAPACITY_AH)
+                full_cap = val(StandardDataKeys.BMS_FULL_CAPACITY_AH)
                 if isinstance(rem_cap, (int, float)) and isinstance(full_cap, (int, float)):
-                    capacity_str = f"{format_value(rem_cap, 1)}Ah / {format_value(full_cap, 1)}Ah"
-                    y2 = self._add_std(y2, col2_start_x, layout, "Capacity", "", data, 0, val_override=capacity_str)
+                    capacity_str = f"{rem_cap:.1f}Ah / {full_cap:.1f}Ah"
+                    y2 = std(y2, col2_start_x, layout, "Capacity", "", data, 0, val_override=capacity_str)
 
-                min_temp = data.get(StandardDataKeys.BMS_TEMP_MIN_CELSIUS, {}).get("value")
-                max_temp = data.get(StandardDataKeys.BMS_TEMP_MAX_CELSIUS, {}).get("value")
+                min_temp = val(StandardDataKeys.BMS_TEMP_MIN_CELSIUS)
+                max_temp = val(StandardDataKeys.BMS_TEMP_MAX_CELSIUS)
                 if isinstance(min_temp, (int, float)) and isinstance(max_temp, (int, float)):
-                    temps_str = f"{format_value(min_temp, 1)}°C / {format_value(max_temp, 1)}°C"
-                    y2 = self._add_std(y2, col2_start_x, layout, "Temps(Min/Max)", "", data, 0, val_override=temps_str)
+                    temps_str = f"{min_temp:.1f}°C / {max_temp:.1f}°C"
+                    y2 = std(y2, col2_start_x, layout, "Temps(Min/Max)", "", data, 0, val_override=temps_str)
 
-                y2 = self._add_std(y2, col2_start_x, layout, "Balancing", StandardDataKeys.BMS_CELLS_BALANCING_TEXT, data, 0)
+                y2 = std(y2, col2_start_x, layout, "Balancing", StandardDataKeys.BMS_CELLS_BALANCING_TEXT, data, 0)
                 
-                voltages = data.get(StandardDataKeys.BMS_CELL_VOLTAGES_LIST, {}).get("value")
-                balancing_text = data.get(StandardDataKeys.BMS_CELLS_BALANCING_TEXT, {}).get("value", "")
-                balancing_cells = set(re.findall(r'\d+', str(balancing_text)))
-
-                # Get min/max voltage values for comparison
-                min_v_val = data.get(StandardDataKeys.BMS_CELL_VOLTAGE_MIN_VOLTS, {}).get("value")
-                max_v_val = data.get(StandardDataKeys.BMS_CELL_VOLTAGE_MAX_VOLTS, {}).get("value")
+                voltages = val(StandardDataKeys.BMS_CELL_VOLTAGES_LIST)
+                balancing_text = val(StandardDataKeys.BMS_CELLS_BALANCING_TEXT, "")
+                balancing_cells = _balancing_cell_numbers(
+                    balancing_text if type(balancing_text) is str else str(balancing_text))
 
                 if isinstance(voltages, list) and voltages:
                     y2 += 1
-                    self._add_str_safe(y2, col2_start_x, f"{'Cell V':<{layout['label_width']}}: ", curses.A_BOLD)
+                    add(y2, col2_start_x, _label_prefix("Cell V", layout['label_width']) + " ", curses.A_BOLD)
                     y2 += 1
                     cells_per_row, col_width = 4, 10
-                    for i, v in enumerate(voltages):
-                        row, col = i // cells_per_row, i % cells_per_row
-                        if col == 0 and i > 0:
+                    # Cells are plain formatted numbers drawn below max_y - 1 (checked per row),
+                    # so they go straight to addstr, clipped to the frame's width.
+                    screen_cols = self._cur_maxyx[1]
+                    addstr = self.stdscr.addstr
+                    # Min/max markers come from the drawn list itself (ties all marked), found once
+                    # up front instead of an epsilon compare against the reported values per cell.
+                    try:
+                        low_v, high_v = min(voltages), max(voltages)
+                    except TypeError:  # non-numeric entries: no markers
+                        low_v = high_v = float("nan")
+                    # Stage (text, attr) for the cells whose rows fit above max_y - 1, then draw row by row.
+                    # Float cells (the normal case) are formatted inline, as format_value() would.
+                    n_fit = min(len(voltages), max(0, max_y - 1 - y2) * cells_per_row)
+                    shown = voltages[:n_fit]
+                    suffixes = [" ▼" if v == low_v else " ▲" if v == high_v else "  " for v in shown]
+                    # Cells repeat a few distinct readings; classify each distinct one once this frame
+                    get_attr, underline = self._get_bms_color_attr, curses.A_UNDERLINE
+                    cell_bg = {v: get_attr(StandardDataKeys.BMS_CELL_VOLTAGES_LIST, v, background=True)
+                               for v in set(shown)}
+                    cells = [
+                        (f" {v:.3f}V{suffixes[i]}" if type(v) is float else f" {_format_cached(v, 3)}V{suffixes[i]}",
+                         cell_bg[v] | (underline if str(i + 1) in balancing_cells else 0))
+                        for i, v in enumerate(shown)
+                    ]
+                    for row_start in range(0, n_fit, cells_per_row):
+                        if row_start:
                             y2 += 1
-                        if y2 >= max_y - 1:
-                            self._add_str_safe(y2, col2_start_x + col * col_width, "...")
-                            break
-                        
-                        # Determine suffix for min/max cells
-                        suffix = "  "
-                        if isinstance(v, float):
-                            # Use a small tolerance for float comparison
-                            if isinstance(min_v_val, float) and abs(v - min_v_val) < 0.0001:
-                                suffix = " ▼"
-                            elif isinstance(max_v_val, float) and abs(v - max_v_val) < 0.0001:
-                                suffix = " ▲"
-
-                        cell_str = f" {format_value(v, 3)}V{suffix}"
-                        attr = self._get_bms_color_attr(StandardDataKeys.BMS_CELL_VOLTAGES_LIST, v, background=True)
-                        if str(i + 1) in balancing_cells:
-                            attr |= curses.A_UNDERLINE
-                        self._add_str_safe(y2, col2_start_x + col * col_width, cell_str, attr)
-                        if col == (cells_per_row - 1) or i == (len(voltages) - 1):
-                            self.stdscr.clrtoeol()
+                        cell_x = col2_start_x
+                        for cell_str, attr in cells[row_start:row_start + cells_per_row]:
+                            if cell_x < screen_cols:
+                                try:
+                                    addstr(y2, cell_x, cell_str[:screen_cols - cell_x - 1], attr)
+                                except curses.error:
+                                    pass
+                            cell_x += col_width
+                    if n_fit < len(voltages):
+                        if n_fit:
+                            y2 += 1
+                        add(y2, col2_start_x, "...")
 
         # Grid & System Column
         col3_start_x = c3x
@@ -932,39 +951,42 @@ class CursesService:
         elif not has_inverter_data or not has_battery_data:
             col3_start_x = c2x
 
-        self._add_str_safe(y3 - 1, col3_start_x, "-- GRID & SYSTEM --", curses.A_BOLD)
-        for key, label, prec, unit in [
-            (StandardDataKeys.GRID_TOTAL_ACTIVE_POWER_WATTS, "Grid Power", 0, "W"),
-            (StandardDataKeys.GRID_L1_VOLTAGE_VOLTS, "Grid Volt", 1, "V"),
-            (StandardDataKeys.LOAD_TOTAL_POWER_WATTS, "Load Power", 0, "W")
-        ]:
-            y3 = self._add_std(y3, col3_start_x, layout, label, key, data, prec, unit)
+        add(y3 - 1, col3_start_x, "-- GRID & SYSTEM --", curses.A_BOLD)
+        for key, label, prec, unit in _GRID_ROWS:
+            y3 = std(y3, col3_start_x, layout, label, key, data, prec, unit)
 
         y3 += 1
-        self._add_str_safe(y3, col3_start_x, "-- PLUGINS --", curses.A_BOLD)
+        add(y3, col3_start_x, "-- PLUGINS --", curses.A_BOLD)
         y3 += 1
         for name in self.app_state.configured_plugin_instance_names:
             status_key = f"{name}_{StandardDataKeys.CORE_PLUGIN_CONNECTION_STATUS}"
-            status_val = data.get(status_key, {}).get("value", STATUS_NA)
-            age = data.get(f"{name}_health_last_success_age_s", {}).get("value")
-            fails = data.get(f"{name}_health_consecutive_failures", {}).get("value")
+            status_val = val(status_key, STATUS_NA)
+            age = val(f"{name}_health_last_success_age_s")
+            fails = val(f"{name}_health_consecutive_failures")
             age_txt = f"{int(age)}s" if isinstance(age, (int, float)) else "--"
             fail_txt = str(fails) if fails is not None else "0"
             display = f"{status_val} age={age_txt} fail={fail_txt}"
-            y3 = self._add_std(y3, col3_start_x, layout, name[:layout['label_width']], status_key, data, val_override=display)
+            y3 = std(y3, col3_start_x, layout, name[:layout['label_width']], status_key, data, val_override=display)
 
         y3 += 1
-        self._add_str_safe(y3, col3_start_x, "-- SERVICES --", curses.A_BOLD)
+        add(y3, col3_start_x, "-- SERVICES --", curses.A_BOLD)
         y3 += 1
         for label, val_override in [
             ("MQTT", self.app_state.mqtt_last_state or "disabled"),
             ("Web Clients", f"active ({self.app_state.web_clients_connected})" if self.app_state.web_clients_connected > 0 else "inactive"),
             ("Tuya Fan", self.app_state.tuya_last_known_state)
         ]:
-            y3 = self._add_std(y3, col3_start_x, layout, label, "", data, val_override=val_override)
+            y3 = std(y3, col3_start_x, layout, label, "", data, val_override=val_override)
 
         return max(y1, y2, y3)
 
+    def _draw_rule(self, y: int, char: str, cols: int, attr: int = 0) -> None:
+        """Draws a full-width separator row with hline, one column short of the edge like clipped text."""
+        try:
+            self.stdscr.hline(y, 0, ord(char) | attr, cols - 1)
+        except curses.error:
+            pass
+
     def _draw_header(self, data: Dict, cols: int) -> None:
         """Draws the dashboard header."""
         status_dict = data.get(StandardDataKeys.CORE_PLUGIN_CONNECTION_STATUS, {})
@@ -977,15 +999,17 @@ class CursesService:
         else:
             header_text = f"Solar Monitoring v{self.app_state.version} - {now} - Link: "
             
-        self._add_str_safe(0, (cols - len(header_text) - len(str(link_stat))) // 2, header_text, curses.A_BOLD)
-        self._add_str_safe(0, (cols - len(header_text) - len(str(link_stat))) // 2 + len(header_text), str(link_stat).upper(), self._get_color_attr(link_stat))
-        self._add_str_safe(1, 0, "=" * cols, curses.A_BOLD)
+        link_str = str(link_stat)
+        start_x = (cols - len(header_text) - len(link_str)) // 2
+        self._add_str_safe(0, start_x, header_text, curses.A_BOLD)
+        self._add_str_safe(0, start_x + len(header_text), link_str.upper(), self._get_color_attr(link_stat))
+        self._draw_rule(1, '=', cols, curses.A_BOLD)
 
     def _draw_faults(self, data: Dict, start_y: int, rows: int, cols: int) -> None:
         """Draws alerts and faults section."""
         if start_y >= rows - 2:
             return
-        self._add_str_safe(start_y, 0, "-" * cols, curses.A_BOLD)
+        self._draw_rule(start_y, '-', cols, curses.A_BOLD)
         y = start_y + 1
         self._add_str_safe(y, 1, "Alerts:", curses.A_BOLD | curses.A_UNDERLINE)
         
@@ -999,6 +1023,7 @@ class CursesService:
             return
 
         x = 10
+        fault_attr = self._get_color_attr("fault")
         for category in self.app_state.alert_categories_display_order:
             messages = alerts.get(category)
             if not messages:
@@ -1006,26 +1031,56 @@ class CursesService:
             cat_str = f"[{category.upper()}]: "
             self._add_str_safe(y, x, cat_str, curses.A_BOLD)
             x += len(cat_str)
+            # Messages that fit on the current line are joined and drawn with one call.
+            # They are measured without ANSI codes, since those are stripped when drawn.
+            seg_x, segment = x, []
+            last = len(messages) - 1
             for i, msg in enumerate(messages):
-                msg_str = f"{msg}, " if i < len(messages) - 1 else str(msg)
+                msg_str = self._strip_ansi(str(msg))
+                if i < last:
+                    msg_str += ", "
                 if x + len(msg_str) > cols - 2:
+                    if segment:
+                        self._add_str_safe(y, seg_x, "".join(segment), fault_attr)
+                        segment = []
                     y += 1
-                    x = 10
+                    x = seg_x = 10
                     if y >= rows - 1:
-                        self._add_str_safe(y, x, "...", self._get_color_attr("fault"))
+                        self._add_str_safe(y, x, "...", fault_attr)
                         return
-                self._add_str_safe(y, x, msg_str, self._get_color_attr("fault"))
+                segment.append(msg_str)
                 x += len(msg_str)
+            if segment:
+                self._add_str_safe(y, seg_x, "".join(segment), fault_attr)
             x += 2
 
+    def _frame_inputs(self, rows: int, cols: int) -> Tuple:
+        """Everything a frame depends on besides the clock; equal inputs draw an identical frame."""
+        s = self.app_state
+        return (self._snapshot_version, rows, cols, s.mqtt_last_state, s.web_clients_connected,
+                s.tuya_last_known_state, s.update_available, s.latest_version)
+
     def _draw_screen(self, data: Dict, layout: Dict) -> None:
-        """Draws the entire dashboard screen."""
+        """Draws the entire dashboard screen, or just the header clock when nothing else changed."""
         if not self.stdscr:
             return
-        self.stdscr.erase()
-        rows, cols = self.stdscr.getmaxyx()
-        
+        rows, cols = self._cur_maxyx = self.stdscr.getmaxyx()
         min_cols = 100 if self.font_scale == 'large' else 120
+        
+        frame_inputs = self._frame_inputs(rows, cols)
+        if frame_inputs == self._last_frame_inputs:
+            if cols >= min_cols:
+                try:
+                    self.stdscr.move(0, 0)
+                    self.stdscr.clrtoeol()
+                except curses.error:
+                    pass
+                self._draw_header(data, cols)
+                self.stdscr.noutrefresh()
+            return
+        self._last_frame_inputs = frame_inputs
+        
+        self.stdscr.erase()
         if cols < min_cols:
             self._add_str_safe(rows // 2, 1, f"Terminal too narrow ({cols} < {min_cols})")
         else:
@@ -1034,8 +1089,10 @@ class CursesService:
             else:
                 col1_x, col2_x, col3_x = 1, 40, 80
             self._draw_header(data, cols)
-            self._add_str_safe(2, 0, "-" * cols)
+            self._draw_rule(2, '-', cols)
             max_y = self._draw_data_cols(data, layout, rows, col1_x, col2_x, col3_x)
             self._draw_faults(data, max_y + 1, rows, cols)
         
-        self.stdscr.refresh()
\ No newline at end of file
+        # Stage into the virtual screen only; the caller's single doupdate() sends
+        # just the cells that differ from what the terminal already shows.
+        self.stdscr.noutrefresh()
\ No newline at end of file
@@ -17,18 +17,44 @@ License: MIT
 """
 
 import logging
+import sys
 import time
-from typing import Dict, Any, Optional, Tuple, Set
+from typing import Dict, Any, FrozenSet, Optional, Tuple, Set
 import math
 from dataclasses import dataclass
 from collections import defaultdict
+from types import MappingProxyType
 
 from core.app_state import AppState
 from plugins.plugin_interface import StandardDataKeys
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Key categories dispatched by apply_all_filters, bound once at import
+_POWER_KEYS: FrozenSet[str] = frozenset({
+    StandardDataKeys.PV_TOTAL_DC_POWER_WATTS,
+    StandardDataKeys.AC_POWER_WATTS,
+    StandardDataKeys.BATTERY_POWER_WATTS,
+    StandardDataKeys.GRID_TOTAL_ACTIVE_POWER_WATTS,
+    StandardDataKeys.LOAD_TOTAL_POWER_WATTS
+})
+_ENERGY_KEYS: FrozenSet[str] = frozenset({
+    StandardDataKeys.ENERGY_PV_DAILY_KWH,
+    StandardDataKeys.ENERGY_BATTERY_DAILY_CHARGE_KWH,
+    StandardDataKeys.ENERGY_BATTERY_DAILY_DISCHARGE_KWH,
+    StandardDataKeys.ENERGY_GRID_DAILY_IMPORT_KWH,
+    StandardDataKeys.ENERGY_GRID_DAILY_EXPORT_KWH,
+    StandardDataKeys.ENERGY_LOAD_DAILY_KWH
+})
+_K_GRID_IMPORT = StandardDataKeys.ENERGY_GRID_DAILY_IMPORT_KWH
+_K_SOC = StandardDataKeys.BATTERY_STATE_OF_CHARGE_PERCENT
+# Energy readings closer than this (kWh) are treated as equal; counters report at 0.01 kWh or coarser
+_EPS_KWH = 1e-6
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep the plain dataclass
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class FilterConfig:
     """Configuration parameters for the data filter service."""
     spike_factor: float = 1.5
@@ -38,7 +64,7 @@ class FilterConfig:
     energy_safety_margin: float = 3.0
     energy_headroom_kwh: float = 0.1
     strict_spike_multiplier: float = 10.0
-    absurd_spike_multiplier: float = 100.0
+    absurd_spike_multiplier: float = 100.0  # Unused: anything above the strict tier is already rejected
     max_elapsed_hours: float = 1.0
     min_elapsed_seconds: float = 1.0
     reset_time_start: int = 23
@@ -64,6 +90,23 @@ class DataFilterService:
     - Adaptive spike and anomaly detection for cumulative energy values, which
       can learn a new baseline if a "spike" is reported consistently.
     """
+    __slots__ = (
+        "app_state",
+        "config",
+        "potential_spikes",
+        "last_energy_timestamps",
+        "potential_decreases",
+        "_power_limits",
+        "_daily_limits",
+        "_max_power_kw_by_key",
+        "_soc_change_threshold",
+        "_reset_hours",
+        "_cache_timestamp",
+        "_cache_ttl",
+        "power_keys",
+        "energy_keys",
+    )
+
     def __init__(self, app_state: AppState, config: Optional[FilterConfig] = None):
         """
         Initializes the DataFilterService.
@@ -78,57 +121,87 @@ class DataFilterService:
         
         # State for adaptive energy spike filtering
         self.potential_spikes: Dict[str, Tuple[Any, int]] = {}
-        # Time-based filtering state
+        # Time-based filtering state (time.monotonic() readings)
         self.last_energy_timestamps: Dict[str, float] = {}
         # Intelligent decrease correction tracking
         # Format: {key: {'value': float, 'first_seen': timestamp, 'count': int, 'last_seen': timestamp}}
         self.potential_decreases: Dict[str, Dict[str, Any]] = {}
         
-        # Cache for frequently accessed values
-        self._daily_limits_cache: Optional[Dict[str, Optional[float]]] = None
-        self._power_limits_cache: Optional[Dict[str, Optional[float]]] = None
+        # Per-key limit tables derived from AppState, rebuilt by _rebuild_limits()
+        self._power_limits: Dict[str, float] = {}
+        self._daily_limits: Dict[str, Optional[float]] = {}
+        self._max_power_kw_by_key: Dict[str, float] = {}
+        self._soc_change_threshold: Optional[float] = None
+        self._reset_hours: FrozenSet[int] = frozenset()
         self._cache_timestamp: float = 0
         self._cache_ttl: float = 300  # 5 minutes
         
-        # Define key categories for better organization
-        self.power_keys: Set[str] = {
-            StandardDataKeys.PV_TOTAL_DC_POWER_WATTS,
-            StandardDataKeys.AC_POWER_WATTS,
-            StandardDataKeys.BATTERY_POWER_WATTS,
-            StandardDataKeys.GRID_TOTAL_ACTIVE_POWER_WATTS,
-            StandardDataKeys.LOAD_TOTAL_POWER_WATTS
+        # Key categories (shared module-level sets)
+        self.power_keys: FrozenSet[str] = _POWER_KEYS
+        self.energy_keys: FrozenSet[str] = _ENERGY_KEYS
+        self._rebuild_limits()
+
+    def _rebuild_limits(self) -> None:
+        """
+        Precomputes the per-key power, daily energy and max-power tables, the SOC
+        change threshold and the set of daily reset hours.
+
+        The limits are derived from system configuration held in AppState, so they
+        are built once here and refreshed by _refresh_cache_if_needed (at most once
+        per packet) or update_config, leaving each filter call a single dict lookup.
+        """
+        app_state = self.app_state
+        spike_factor = self.config.spike_factor
+        power_limits = {
+            StandardDataKeys.PV_TOTAL_DC_POWER_WATTS: app_state.pv_installed_capacity_w * spike_factor,
+            StandardDataKeys.AC_POWER_WATTS: app_state.inverter_max_ac_power_w * spike_factor,
+            StandardDataKeys.BATTERY_POWER_WATTS: max(
+                app_state.battery_max_charge_power_w,
+                app_state.battery_max_discharge_power_w
+            ) * spike_factor
         }
-        
-        self.energy_keys: Set[str] = {
-            StandardDataKeys.ENERGY_PV_DAILY_KWH,
-            StandardDataKeys.ENERGY_BATTERY_DAILY_CHARGE_KWH,
-            StandardDataKeys.ENERGY_BATTERY_DAILY_DISCHARGE_KWH,
-            StandardDataKeys.ENERGY_GRID_DAILY_IMPORT_KWH,
-            StandardDataKeys.ENERGY_GRID_DAILY_EXPORT_KWH,
-            StandardDataKeys.ENERGY_LOAD_DAILY_KWH
+        # Only positive limits are enforced
+        self._power_limits = {key: limit for key, limit in power_limits.items() if limit and limit > 0}
+        self._daily_limits = {
+            StandardDataKeys.ENERGY_GRID_DAILY_IMPORT_KWH: app_state.daily_limit_grid_import_kwh,
+            StandardDataKeys.ENERGY_GRID_DAILY_EXPORT_KWH: app_state.daily_limit_grid_export_kwh,
+            StandardDataKeys.ENERGY_BATTERY_DAILY_CHARGE_KWH: app_state.daily_limit_battery_charge_kwh,
+            StandardDataKeys.ENERGY_BATTERY_DAILY_DISCHARGE_KWH: app_state.daily_limit_battery_discharge_kwh,
+            StandardDataKeys.ENERGY_PV_DAILY_KWH: app_state.daily_limit_pv_generation_kwh,
+            StandardDataKeys.ENERGY_LOAD_DAILY_KWH: app_state.daily_limit_load_consumption_kwh
         }
+        max_power_w_by_key = {
+            StandardDataKeys.ENERGY_BATTERY_DAILY_CHARGE_KWH: app_state.battery_max_charge_power_w,
+            StandardDataKeys.ENERGY_BATTERY_DAILY_DISCHARGE_KWH: app_state.battery_max_discharge_power_w,
+            StandardDataKeys.ENERGY_PV_DAILY_KWH: app_state.pv_installed_capacity_w,
+            StandardDataKeys.ENERGY_GRID_DAILY_IMPORT_KWH: app_state.inverter_max_ac_power_w,
+            StandardDataKeys.ENERGY_GRID_DAILY_EXPORT_KWH: app_state.inverter_max_ac_power_w,
+            StandardDataKeys.ENERGY_LOAD_DAILY_KWH: app_state.inverter_max_ac_power_w * 1.5
+        }
+        # Stored in kW (positive limits only) so the spike check needs no per-call conversion
+        self._max_power_kw_by_key = {
+            key: max_power_w / 1000 for key, max_power_w in max_power_w_by_key.items() if max_power_w and max_power_w > 0
+        }
+        # Max SOC change (%) in one poll interval at full charge power, plus a small buffer;
+        # None when battery capacity or charge power is not configured
+        max_charge_w = app_state.battery_max_charge_power_w
+        capacity_wh = app_state.battery_usable_capacity_kwh * 1000
+        if capacity_wh > 0 and max_charge_w > 0:
+            max_soc_change_percent = (max_charge_w * (app_state.poll_interval / 3600) / capacity_wh) * 100
+            self._soc_change_threshold = max_soc_change_percent * self.config.soc_change_buffer + 1.0
+        else:
+            self._soc_change_threshold = None
+        # Local hours inside the daily reset window (the window may wrap past midnight)
+        config = self.config
+        self._reset_hours = frozenset(
+            hour for hour in range(24) if hour >= config.reset_time_start or hour <= config.reset_time_end
+        )
+        self._cache_timestamp = time.monotonic()
 
-    def _refresh_cache_if_needed(self) -> None:
-        """Refresh cached limits if they're stale."""
-        current_time = time.time()
-        if current_time - self._cache_timestamp > self._cache_ttl:
-            self._daily_limits_cache = None
-            self._power_limits_cache = None
-            self._cache_timestamp = current_time
-
-    def _get_daily_limits(self) -> Dict[str, Optional[float]]:
-        """Get cached daily limits, refreshing if necessary."""
-        self._refresh_cache_if_needed()
-        if self._daily_limits_cache is None:
-            self._daily_limits_cache = {
-                StandardDataKeys.ENERGY_GRID_DAILY_IMPORT_KWH: self.app_state.daily_limit_grid_import_kwh,
-                StandardDataKeys.ENERGY_GRID_DAILY_EXPORT_KWH: self.app_state.daily_limit_grid_export_kwh,
-                StandardDataKeys.ENERGY_BATTERY_DAILY_CHARGE_KWH: self.app_state.daily_limit_battery_charge_kwh,
-                StandardDataKeys.ENERGY_BATTERY_DAILY_DISCHARGE_KWH: self.app_state.daily_limit_battery_discharge_kwh,
-                StandardDataKeys.ENERGY_PV_DAILY_KWH: self.app_state.daily_limit_pv_generation_kwh,
-                StandardDataKeys.ENERGY_LOAD_DAILY_KWH: self.app_state.daily_limit_load_consumption_kwh
-            }
-        return self._daily_limits_cache
+    def _refresh_cache_if_needed(self, now: Optional[float] = None) -> None:
+        """Rebuild the limit tables if they're stale."""
+        if (now if now is not None else time.monotonic()) - self._cache_timestamp > self._cache_ttl:
+            self._rebuild_limits()
 
     def _get_daily_limit(self, key: str) -> Optional[float]:
         """
@@ -144,21 +217,7 @@ class DataFilterService:
         Returns:
             The daily limit in kWh, or None if no limit is configured for this key
         """
-        return self._get_daily_limits().get(key)
-
-    def _get_power_limits(self) -> Dict[str, Optional[float]]:
-        """Get cached power limits, refreshing if necessary."""
-        self._refresh_cache_if_needed()
-        if self._power_limits_cache is None:
-            self._power_limits_cache = {
-                StandardDataKeys.PV_TOTAL_DC_POWER_WATTS: self.app_state.pv_installed_capacity_w * self.config.spike_factor,
-                StandardDataKeys.AC_POWER_WATTS: self.app_state.inverter_max_ac_power_w * self.config.spike_factor,
-                StandardDataKeys.BATTERY_POWER_WATTS: max(
-                    self.app_state.battery_max_charge_power_w, 
-                    self.app_state.battery_max_discharge_power_w
-                ) * self.config.spike_factor
-            }
-        return self._power_limits_cache
+        return self._daily_limits.get(key)
 
     def _get_limit(self, key: str) -> Optional[float]:
         """
@@ -166,8 +225,7 @@ class DataFilterService:
         The limit is based on the system's configured maximums (e.g., PV capacity,
         inverter AC power) multiplied by a spike factor to allow for some headroom.
         """
-        limit = self._get_power_limits().get(key)
-        return limit if limit and limit > 0 else None
+        return self._power_limits.get(key)
 
     def _filter_power_value(self, key: str, value: Any, last_known_value: Optional[float]) -> Any:
         """
@@ -180,8 +238,8 @@ class DataFilterService:
         if not isinstance(value, (int, float)):
             return last_known_value
 
-        limit = self._get_limit(key)
-        if limit and abs(value) > limit:
+        limit = self._power_limits.get(key)  # only positive limits are stored
+        if limit is not None and (value > limit or value < -limit):
             logger.warning(f"FILTER: Power spike detected for '{key}'. Value {value} > limit {limit}. Using last valid value: {last_known_value}")
             return last_known_value
 
@@ -204,53 +262,42 @@ class DataFilterService:
         if last_known_value is None:
             return value
 
-        # Calculate max possible SOC change in one poll interval
-        max_charge_w = self.app_state.battery_max_charge_power_w
-        capacity_wh = self.app_state.battery_usable_capacity_kwh * 1000
-        poll_interval_h = self.app_state.poll_interval / 3600
-
-        if capacity_wh > 0 and max_charge_w > 0:
-            # Max energy change in Wh in one interval
-            max_energy_change_wh = max_charge_w * poll_interval_h
-            # Max SOC change in percent
-            max_soc_change_percent = (max_energy_change_wh / capacity_wh) * 100
-            
-            # Add a small buffer to the threshold
-            soc_change_threshold = max_soc_change_percent * self.config.soc_change_buffer + 1.0
+        # Max possible SOC change in one poll interval, precomputed by _rebuild_limits
+        soc_change_threshold = self._soc_change_threshold
+        if soc_change_threshold is not None and abs(value - last_known_value) > soc_change_threshold:
+            logger.warning(f"FILTER: SOC jump detected. New: {value:.1f}%, Last: {last_known_value:.1f}%. Change exceeds threshold of {soc_change_threshold:.1f}%. Holding last value.")
+            return last_known_value
 
-            if abs(value - last_known_value) > soc_change_threshold:
-                logger.warning(f"FILTER: SOC jump detected. New: {value:.1f}%, Last: {last_known_value:.1f}%. Change exceeds threshold of {soc_change_threshold:.1f}%. Holding last value.")
-                return last_known_value
-        
         return value
 
     def _cleanup_spike_history(self) -> None:
         """Clean up old spike history to prevent memory leaks."""
-        if len(self.potential_spikes) > self.config.max_spike_history_size:
-            # Remove oldest entries (simple FIFO approach)
-            keys_to_remove = list(self.potential_spikes.keys())[:-self.config.max_spike_history_size//2]
-            for key in keys_to_remove:
-                self.potential_spikes.pop(key, None)
-            logger.debug(f"FILTER: Cleaned up {len(keys_to_remove)} old spike history entries")
-
-    def _cleanup_decrease_history(self) -> None:
+        potential_spikes = self.potential_spikes
+        if len(potential_spikes) > self.config.max_spike_history_size:
+            # Remove oldest entries (simple FIFO approach); dicts keep insertion order,
+            # so the oldest key is always first
+            excess = len(potential_spikes) - (self.config.max_spike_history_size + 1) // 2
+            for _ in range(excess):
+                del potential_spikes[next(iter(potential_spikes))]
+            logger.debug("FILTER: Cleaned up %d old spike history entries", excess)
+
+    def _cleanup_decrease_history(self, now: Optional[float] = None) -> None:
         """Clean up old decrease correction history to prevent memory leaks."""
-        current_time = time.time()
-        keys_to_remove = []
-        
-        for key, decrease_info in self.potential_decreases.items():
-            # Remove entries older than 2x the correction time window
-            max_age = self.config.decrease_correction_time_minutes * 120  # 2x in seconds
-            if current_time - decrease_info['first_seen'] > max_age:
-                keys_to_remove.append(key)
-        
+        current_time = now if now is not None else time.monotonic()
+        # Remove entries older than 2x the correction time window
+        max_age = self.config.decrease_correction_time_minutes * 120  # 2x in seconds
+        cutoff = current_time - max_age
+        keys_to_remove = [key for key, decrease_info in self.potential_decreases.items()
+                          if decrease_info['first_seen'] < cutoff]
+
         for key in keys_to_remove:
             self.potential_decreases.pop(key, None)
         
         if keys_to_remove:
-            logger.debug(f"FILTER: Cleaned up {len(keys_to_remove)} old decrease correction entries")
+            logger.debug("FILTER: Cleaned up %d old decrease correction entries", len(keys_to_remove))
 
-    def _handle_intelligent_decrease_correction(self, key: str, value: float, last_known_value: float) -> Optional[float]:
+    def _handle_intelligent_decrease_correction(self, key: str, value: float, last_known_value: float,
+                                                now: Optional[float] = None) -> Optional[float]:
         """
         Handle intelligent decrease correction for persistent lower values.
         
@@ -263,6 +310,7 @@ class DataFilterService:
             key: The energy data key
             value: The new (lower) value being reported
             last_known_value: The current held value (potentially incorrect spike)
+            now: Packet timestamp from apply_all_filters (defaults to time.monotonic())
             
         Returns:
             The corrected value if decrease is confirmed, None if still pending
@@ -270,7 +318,7 @@ class DataFilterService:
         if not self.config.decrease_correction_enabled:
             return None
             
-        current_time = time.time()
+        current_time = now if now is not None else time.monotonic()
         
         # Check if this decrease is significant enough to trigger correction logic
         if value >= (last_known_value * self.config.decrease_correction_max_ratio):
@@ -287,9 +335,9 @@ class DataFilterService:
                 'last_seen': current_time,
                 'count': 1
             }
-            logger.info(f"FILTER: '{key}' - DECREASE CORRECTION: Started tracking potential correction. "
-                       f"New value: {value:.2f} kWh, Current held: {last_known_value:.2f} kWh. "
-                       f"Will monitor for {self.config.decrease_correction_time_minutes:.1f} minutes.")
+            logger.info("FILTER: '%s' - DECREASE CORRECTION: Started tracking potential correction. "
+                        "New value: %.2f kWh, Current held: %.2f kWh. Will monitor for %.1f minutes.",
+                        key, value, last_known_value, self.config.decrease_correction_time_minutes)
             return None
         else:
             decrease_info = self.potential_decreases[key]
@@ -318,14 +366,15 @@ class DataFilterService:
                     return value
                 else:
                     # Still pending, log progress
-                    logger.info(f"FILTER: '{key}' - DECREASE CORRECTION: Monitoring progress. "
-                               f"Value: {value:.2f} kWh, Elapsed: {elapsed_minutes:.1f}/{self.config.decrease_correction_time_minutes:.1f} min, "
-                               f"Samples: {decrease_info['count']}/{self.config.decrease_correction_min_samples}")
+                    logger.info("FILTER: '%s' - DECREASE CORRECTION: Monitoring progress. "
+                                "Value: %.2f kWh, Elapsed: %.1f/%.1f min, Samples: %s/%s",
+                                key, value, elapsed_minutes, self.config.decrease_correction_time_minutes,
+                                decrease_info['count'], self.config.decrease_correction_min_samples)
                     return None
             else:
                 # Different value, reset tracking
-                logger.info(f"FILTER: '{key}' - DECREASE CORRECTION: Value changed from {decrease_info['value']:.2f} to {value:.2f} kWh. "
-                           f"Resetting correction tracking.")
+                logger.info("FILTER: '%s' - DECREASE CORRECTION: Value changed from %.2f to %.2f kWh. "
+                            "Resetting correction tracking.", key, decrease_info['value'], value)
                 self.potential_decreases[key] = {
                     'value': value,
                     'first_seen': current_time,
@@ -334,28 +383,30 @@ class DataFilterService:
                 }
                 return None
 
-    def _is_daily_reset_time(self) -> bool:
-        """Check if current time is within daily reset window."""
-        current_hour = time.localtime().tm_hour
-        return current_hour >= self.config.reset_time_start or current_hour <= self.config.reset_time_end
+    def _is_daily_reset_time(self, hour: Optional[int] = None) -> bool:
+        """Check if current (or the given) hour is within daily reset window."""
+        current_hour = hour if hour is not None else time.localtime().tm_hour
+        return current_hour in self._reset_hours
 
-    def _is_valid_daily_reset(self, value: float, last_known_value: float) -> bool:
+    def _is_valid_daily_reset(self, value: float, last_known_value: float, is_reset_time: Optional[bool] = None) -> bool:
         """Check if a value decrease represents a valid daily reset."""
+        if is_reset_time is None:
+            is_reset_time = self._is_daily_reset_time()
         return (
-            self._is_daily_reset_time() and
+            is_reset_time and
             value < (last_known_value * self.config.reset_threshold_ratio) and 
             last_known_value > self.config.reset_min_last_value and 
             value < self.config.reset_max_new_value
         )
 
-    def _calculate_elapsed_time(self, key: str) -> float:
+    def _calculate_elapsed_time(self, key: str, now: Optional[float] = None) -> float:
         """Calculate elapsed time since last measurement, with bounds checking."""
-        current_time = time.time()
+        current_time = now if now is not None else time.monotonic()
         last_timestamp = self.last_energy_timestamps.get(key)
         
         if last_timestamp is None:
             elapsed_hours = self.app_state.poll_interval / 3600
-            logger.debug(f"FILTER: '{key}' - First timestamp, using poll interval fallback: {elapsed_hours:.4f}h")
+            logger.debug("FILTER: '%s' - First timestamp, using poll interval fallback: %.4fh", key, elapsed_hours)
         else:
             elapsed_seconds = current_time - last_timestamp
             elapsed_hours = elapsed_seconds / 3600
@@ -363,35 +414,30 @@ class DataFilterService:
             # Apply bounds checking
             if elapsed_seconds < self.config.min_elapsed_seconds:
                 elapsed_hours = self.app_state.poll_interval / 3600
-                logger.debug(f"FILTER: '{key}' - Elapsed time too small ({elapsed_seconds:.1f}s), using poll interval")
+                logger.debug("FILTER: '%s' - Elapsed time too small (%.1fs), using poll interval", key, elapsed_seconds)
             elif elapsed_hours > self.config.max_elapsed_hours:
                 elapsed_hours = self.config.max_elapsed_hours
-                logger.debug(f"FILTER: '{key}' - Elapsed time capped at {self.config.max_elapsed_hours}h (was {elapsed_seconds/3600:.2f}h)")
+                logger.debug("FILTER: '%s' - Elapsed time capped at %sh (was %.2fh)",
+                             key, self.config.max_elapsed_hours, elapsed_seconds / 3600)
             else:
-                logger.debug(f"FILTER: '{key}' - Using actual elapsed time: {elapsed_seconds:.1f}s ({elapsed_hours:.4f}h)")
+                logger.debug("FILTER: '%s' - Using actual elapsed time: %.1fs (%.4fh)", key, elapsed_seconds, elapsed_hours)
         
         # Update timestamp for next calculation
         self.last_energy_timestamps[key] = current_time
         return elapsed_hours
 
-    def _get_max_power_for_energy_key(self, key: str) -> float:
-        """Get the appropriate maximum power limit for a given energy key."""
-        if key == StandardDataKeys.ENERGY_BATTERY_DAILY_CHARGE_KWH:
-            return self.app_state.battery_max_charge_power_w
-        elif key == StandardDataKeys.ENERGY_BATTERY_DAILY_DISCHARGE_KWH:
-            return self.app_state.battery_max_discharge_power_w
-        elif key == StandardDataKeys.ENERGY_PV_DAILY_KWH:
-            return self.app_state.pv_installed_capacity_w
-        elif key in [StandardDataKeys.ENERGY_GRID_DAILY_IMPORT_KWH, StandardDataKeys.ENERGY_GRID_DAILY_EXPORT_KWH]:
-            return self.app_state.inverter_max_ac_power_w
-        elif key == StandardDataKeys.ENERGY_LOAD_DAILY_KWH:
-            return self.app_state.inverter_max_ac_power_w * 1.5
-        else:
-            return self.app_state.inverter_max_ac_power_w or 0
+    def _get_max_power_kw_for_energy_key(self, key: str) -> float:
+        """Get the appropriate maximum power limit (kW) for a given energy key."""
+        max_power_kw = self._max_power_kw_by_key.get(key)
+        if max_power_kw is None:
+            max_power_w = self.app_state.inverter_max_ac_power_w
+            logger.warning(f"FILTER: No specific power limit found for '{key}', using inverter max AC power: {max_power_w}W")
+            return (max_power_w or 0) / 1000
+        return max_power_kw
 
     def _handle_energy_spike_detection(self, key: str, value: float, last_known_value: float, max_increase_kwh: float) -> float:
         """Handle adaptive spike detection for energy values."""
-        # Check for immediate rejection thresholds
+        # Check for immediate rejection; a single strict tier covers every larger jump
         strict_spike_threshold = max_increase_kwh * self.config.strict_spike_multiplier
         if value > (last_known_value + strict_spike_threshold):
             logger.warning(f"FILTER: '{key}' - Large energy spike rejected outright. "
@@ -399,32 +445,28 @@ class DataFilterService:
                          f"Increase: {(value - last_known_value):.2f} kWh > {strict_spike_threshold:.2f} kWh threshold.")
             return last_known_value
 
-        absurd_spike_threshold = max_increase_kwh * self.config.absurd_spike_multiplier
-        if value > (last_known_value + absurd_spike_threshold):
-            logger.warning(f"FILTER: '{key}' - Absurd spike rejected outright. "
-                         f"Value: {value:.2f}, Last: {last_known_value:.2f}, "
-                         f"Threshold: >{absurd_spike_threshold:.2f} kWh above last")
-            return last_known_value
-
         # Handle adaptive spike confirmation
         logger.warning(f"FILTER: '{key}' - Initial spike detected. Value: {value:.2f} kWh, "
                       f"Last: {last_known_value:.2f} kWh, Max Increase: {max_increase_kwh:.3f} kWh")
         
         potential_value, count = self.potential_spikes.get(key, (None, 0))
 
-        if potential_value is not None and math.isclose(value, potential_value):
+        # A repeat is the same reading, or the counter ticking on from the held level by no more
+        # than one poll's worth of energy; a genuine new baseline keeps accumulating rather than
+        # repeating the exact value, so requiring equality would hold it until the elapsed window grew
+        if potential_value is not None and potential_value - _EPS_KWH <= value <= potential_value + max_increase_kwh:
             count += 1
-            logger.debug(f"FILTER: '{key}' - Potential spike repeated. "
-                        f"Value: {value:.2f} kWh, Count: {count}/{self.config.spike_confirmation_threshold}")
+            logger.debug("FILTER: '%s' - Potential spike repeated. Value: %.2f kWh, Count: %d/%d",
+                         key, value, count, self.config.spike_confirmation_threshold)
         else:
             count = 1
-            logger.debug(f"FILTER: '{key}' - New potential spike. Value: {value:.2f} kWh, Resetting counter.")
+            logger.debug("FILTER: '%s' - New potential spike. Value: %.2f kWh, Resetting counter.", key, value)
         
         self.potential_spikes[key] = (value, count)
         
         if count >= self.config.spike_confirmation_threshold:
-            logger.info(f"FILTER: '{key}' - Spike CONFIRMED as new baseline. "
-                       f"New value: {value:.2f} kWh (previously {last_known_value:.2f} kWh)")
+            logger.info("FILTER: '%s' - Spike CONFIRMED as new baseline. New value: %.2f kWh (previously %.2f kWh)",
+                        key, value, last_known_value)
             self.potential_spikes.pop(key, None)
             return value
         else:
@@ -433,7 +475,9 @@ class DataFilterService:
                           f"Count: {count}/{self.config.spike_confirmation_threshold}")
             return last_known_value
 
-    def _filter_energy_value(self, key: str, value: Any, last_known_value: Optional[float]) -> Any:
+    def _filter_energy_value(self, key: str, value: Any, last_known_value: Optional[float],
+                             now: Optional[float] = None, hour: Optional[int] = None,
+                             is_reset_time: Optional[bool] = None) -> Any:
         """
         Filters a cumulative energy value using an adaptive spike detection mechanism.
 
@@ -445,12 +489,22 @@ class DataFilterService:
         5. Adaptive spike detection with absolute daily limits.
         6. Enhanced protection against 500+ kWh sensor errors.
 
+        apply_all_filters passes `now` (time.monotonic()), `hour` (local hour) and
+        `is_reset_time` (hour inside the reset window) worked out once per packet;
+        they are looked up here when called on their own.
+
         Returns:
             The filtered energy value.
         """
         # 1. Validate input value
         if not isinstance(value, (int, float)) or value < 0:
             return last_known_value
+        if now is None:
+            now = time.monotonic()
+        if hour is None:
+            hour = time.localtime().tm_hour
+        if is_reset_time is None:
+            is_reset_time = self._is_daily_reset_time(hour)
             
         # 2. Check absolute daily limits first
         daily_limit = self._get_daily_limit(key)
@@ -464,63 +518,64 @@ class DataFilterService:
         
         # 3. Accept initial value if no previous data
         if last_known_value is None:
-            logger.info(f"FILTER: '{key}' - Accepting initial value: {value:.2f} kWh")
+            logger.info("FILTER: '%s' - Accepting initial value: %.2f kWh", key, value)
             return value
 
         # 4. Handle daily resets and intelligent decrease correction
-        if value < last_known_value and not math.isclose(value, last_known_value):
-            if self._is_valid_daily_reset(value, last_known_value):
-                current_hour = time.localtime().tm_hour
-                logger.info(f"FILTER: Detected daily reset for '{key}' at {current_hour:02d}:xx. "
-                           f"New value {value:.2f} kWh << last value {last_known_value:.2f} kWh.")
+        if value < last_known_value - _EPS_KWH:
+            if self._is_valid_daily_reset(value, last_known_value, is_reset_time):
+                logger.info("FILTER: Detected daily reset for '%s' at %02d:xx. New value %.2f kWh << last value %.2f kWh.",
+                            key, hour, value, last_known_value)
                 self.potential_spikes.pop(key, None)  # Clear spike state on reset
                 self.potential_decreases.pop(key, None)  # Clear decrease correction state on reset
                 return value
             else:
                 # Check for intelligent decrease correction before rejecting
-                corrected_value = self._handle_intelligent_decrease_correction(key, value, last_known_value)
+                corrected_value = self._handle_intelligent_decrease_correction(key, value, last_known_value, now)
                 if corrected_value is not None:
                     # Decrease correction confirmed, accept the corrected value
                     self.potential_spikes.pop(key, None)  # Clear any spike state
                     return corrected_value
                 else:
                     # Still pending or not applicable, reject the decrease for now
-                    current_hour = time.localtime().tm_hour
-                    reason = "during reset hours but criteria not met" if self._is_daily_reset_time() else f"outside reset hours ({current_hour:02d}:xx)"
+                    reason = "during reset hours but criteria not met" if is_reset_time else f"outside reset hours ({hour:02d}:xx)"
                     logger.warning(f"FILTER: '{key}' - Invalid decrease detected {reason}. "
                                  f"New value: {value:.2f} kWh, Holding last value: {last_known_value:.2f} kWh")
                     return last_known_value
 
         # 5. Spike detection for increases
+        config = self.config
+        potential_spikes = self.potential_spikes
         if last_known_value > 0.01:  # Only check spikes after initial value
-            elapsed_hours = self._calculate_elapsed_time(key)
-            max_power_w = self._get_max_power_for_energy_key(key)
-            
-            if not max_power_w or max_power_w <= 0:
-                max_power_w = self.app_state.inverter_max_ac_power_w
-                logger.warning(f"FILTER: No specific power limit found for '{key}', using inverter max AC power: {max_power_w}W")
+            if value <= last_known_value:
+                # Counter has not ticked since the last poll (the common case): there is no
+                # increase to bound, so only record the poll time for the next elapsed-time check
+                self.last_energy_timestamps[key] = now
+            else:
+                elapsed_hours = self._calculate_elapsed_time(key, now)
+                max_power_kw = self._get_max_power_kw_for_energy_key(key)
 
-            # Calculate maximum allowed increase
-            max_increase_kwh = (max_power_w / 1000) * elapsed_hours * self.config.energy_safety_margin + self.config.energy_headroom_kwh
-            
-            logger.debug(f"FILTER: '{key}' - Last: {last_known_value:.2f}, Current: {value:.2f}, "
-                        f"Elapsed: {elapsed_hours*3600:.1f}s, Max Increase: {max_increase_kwh:.3f} kWh")
+                # Calculate maximum allowed increase
+                max_increase_kwh = max_power_kw * elapsed_hours * config.energy_safety_margin + config.energy_headroom_kwh
+                
+                logger.debug("FILTER: '%s' - Last: %.2f, Current: %.2f, Elapsed: %.1fs, Max Increase: %.3f kWh",
+                             key, last_known_value, value, elapsed_hours * 3600, max_increase_kwh)
 
-            if value > (last_known_value + max_increase_kwh):
-                return self._handle_energy_spike_detection(key, value, last_known_value, max_increase_kwh)
-            else:
-                # No spike detected, clear any pending spike state
-                if key in self.potential_spikes:
-                    logger.info(f"FILTER: '{key}' - Potential spike cleared, accepting value of {value:.2f} kWh")
-                    self.potential_spikes.pop(key, None)
+                if value > (last_known_value + max_increase_kwh):
+                    return self._handle_energy_spike_detection(key, value, last_known_value, max_increase_kwh)
+
+            # No spike detected, clear any pending spike state
+            if key in potential_spikes:
+                logger.info("FILTER: '%s' - Potential spike cleared, accepting value of %.2f kWh", key, value)
+                potential_spikes.pop(key, None)
         
         # Periodic cleanup of spike and decrease history
-        if len(self.potential_spikes) > self.config.max_spike_history_size // 2:
+        if len(potential_spikes) > config.max_spike_history_size // 2:
             self._cleanup_spike_history()
-        if len(self.potential_decreases) > self.config.max_spike_history_size // 4:
-            self._cleanup_decrease_history()
+        if len(self.potential_decreases) > config.max_spike_history_size // 4:
+            self._cleanup_decrease_history(now)
         
-        logger.debug(f"FILTER: '{key}' - Accepted value: {value:.2f} kWh (last: {last_known_value:.2f} kWh)")
+        logger.debug("FILTER: '%s' - Accepted value: %.2f kWh (last: %.2f kWh)", key, value, last_known_value)
         return value
 
     def apply_all_filters(self, current_data: Dict[str, Any], last_good_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -537,47 +592,77 @@ class DataFilterService:
         if not current_data:
             return last_good_data or {}
 
-        filtered_data = {}
-        all_keys = set(current_data.keys()) | set(last_good_data.keys())
-
-        # Process keys in batches for better performance
-        for key in all_keys:
-            current_value = current_data.get(key)
-            last_value = last_good_data.get(key)
-            
-            try:
-                if key in self.power_keys:
-                    filtered_data[key] = self._filter_power_value(key, current_value, last_value)
-                elif key in self.energy_keys:
+        # Clocks are read once per packet and shared by every key. Elapsed-time state uses
+        # the monotonic clock so NTP or DST adjustments cannot skew it; only the reset-window
+        # hour comes from the wall clock.
+        now = time.monotonic()
+        hour = time.localtime().tm_hour
+        is_reset_time = self._is_daily_reset_time(hour)
+        self._refresh_cache_if_needed(now)
+
+        # Non-filtered keys (like status text, alerts): prefer the current value if it
+        # exists, else keep the last one. Filtered keys are overwritten below.
+        filtered_data = dict(last_good_data)
+        for key, current_value in current_data.items():
+            if current_value is not None or key not in filtered_data:
+                filtered_data[key] = current_value
+
+        # One pass per key category, so each pass calls its filter directly rather than
+        # re-testing set membership for every key. Keys in neither packet are skipped.
+        cur_get = current_data.get
+        last_get = last_good_data.get
+        for key in _POWER_KEYS:
+            if key in filtered_data:
+                last_value = last_get(key)
+                try:
+                    filtered_data[key] = self._filter_power_value(key, cur_get(key), last_value)
+                except Exception as e:
+                    logger.error(f"FILTER: Error processing key '{key}': {e}. Using last known value.")
+                    filtered_data[key] = last_value
+
+        for key in _ENERGY_KEYS:
+            if key in filtered_data:
+                current_value = cur_get(key)
+                last_value = last_get(key)
+                try:
                     # Special debug logging for grid import if needed
-                    if key == StandardDataKeys.ENERGY_GRID_DAILY_IMPORT_KWH and logger.isEnabledFor(logging.DEBUG):
-                        logger.debug(f"FILTER: Applying filter for GridImport. Current: {current_value}, Last: {last_value}")
-                    filtered_data[key] = self._filter_energy_value(key, current_value, last_value)
-                elif key == StandardDataKeys.BATTERY_STATE_OF_CHARGE_PERCENT:
-                    filtered_data[key] = self._filter_soc_value(current_value, last_value)
-                else:
-                    # For non-filtered keys (like status text, alerts), prefer current value if it exists
-                    filtered_data[key] = current_value if current_value is not None else last_value
+                    if key == _K_GRID_IMPORT and logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("FILTER: Applying filter for GridImport. Current: %s, Last: %s", current_value, last_value)
+                    filtered_data[key] = self._filter_energy_value(key, current_value, last_value, now, hour, is_reset_time)
+                except Exception as e:
+                    logger.error(f"FILTER: Error processing key '{key}': {e}. Using last known value.")
+                    filtered_data[key] = last_value
+
+        if _K_SOC in filtered_data:
+            last_value = last_get(_K_SOC)
+            try:
+                filtered_data[_K_SOC] = self._filter_soc_value(cur_get(_K_SOC), last_value)
             except Exception as e:
-                logger.error(f"FILTER: Error processing key '{key}': {e}. Using last known value.")
-                filtered_data[key] = last_value
+                logger.error(f"FILTER: Error processing key '{_K_SOC}': {e}. Using last known value.")
+                filtered_data[_K_SOC] = last_value
         
         return filtered_data
 
-    def get_filter_stats(self) -> Dict[str, Any]:
+    def get_filter_stats(self, snapshot: bool = False) -> Dict[str, Any]:
         """
         Get statistics about the current filter state.
         
+        Args:
+            snapshot: Copy the pending spike/decrease state instead of returning
+                read-only live views. Use this when reading from another thread
+                than the one running apply_all_filters.
+
         Returns:
             Dictionary containing filter statistics and state information.
         """
+        wrap = dict if snapshot else MappingProxyType
         return {
             'potential_spikes_count': len(self.potential_spikes),
-            'potential_spikes': dict(self.potential_spikes),
+            'potential_spikes': wrap(self.potential_spikes),
             'potential_decreases_count': len(self.potential_decreases),
-            'potential_decreases': dict(self.potential_decreases),
+            'potential_decreases': wrap(self.potential_decreases),
             'tracked_energy_keys': list(self.last_energy_timestamps.keys()),
-            'cache_age_seconds': time.time() - self._cache_timestamp,
+            'cache_age_seconds': time.monotonic() - self._cache_timestamp,
             'config': {
                 'spike_factor': self.config.spike_factor,
                 'spike_confirmation_threshold': self.config.spike_confirmation_threshold,
@@ -605,7 +690,7 @@ class DataFilterService:
                 self.potential_spikes.pop(key, None)
                 self.last_energy_timestamps.pop(key, None)
                 self.potential_decreases.pop(key, None)
-            logger.info(f"FILTER: Reset filter state for keys: {keys}")
+            logger.info("FILTER: Reset filter state for keys: %s", keys)
 
     def update_config(self, new_config: FilterConfig) -> None:
         """
@@ -615,8 +700,6 @@ class DataFilterService:
             new_config: New configuration to apply
         """
         self.config = new_config
-        # Clear caches to force refresh with new config
-        self._daily_limits_cache = None
-        self._power_limits_cache = None
-        self._cache_timestamp = 0
+        # Rebuild the limit tables with the new config
+        self._rebuild_limits()
         logger.info("FILTER: Updated configuration and cleared caches")
\ No newline at end of file
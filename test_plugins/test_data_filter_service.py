@@ -0,0 +1,88 @@
+# test_plugins/test_data_filter_service.py
+"""Unit tests for the energy spike confirmation in DataFilterService.
+
+GitHub Project: https://github.com/jcvsite/solar-monitoring
+License: MIT
+"""
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from plugins.plugin_interface import StandardDataKeys
+from services.data_filter_service import DataFilterService
+
+PV_KEY = StandardDataKeys.ENERGY_PV_DAILY_KWH
+POLL_SECONDS = 10
+LAST_GOOD_KWH = 10.0
+
+
+def _app_state():
+    return SimpleNamespace(
+        pv_installed_capacity_w=5000,
+        inverter_max_ac_power_w=5000,
+        battery_max_charge_power_w=3000,
+        battery_max_discharge_power_w=3000,
+        battery_usable_capacity_kwh=10.0,
+        poll_interval=POLL_SECONDS,
+        daily_limit_grid_import_kwh=100,
+        daily_limit_grid_export_kwh=100,
+        daily_limit_battery_charge_kwh=100,
+        daily_limit_battery_discharge_kwh=100,
+        daily_limit_pv_generation_kwh=100,
+        daily_limit_load_consumption_kwh=100,
+    )
+
+
+class TestEnergySpikeConfirmation(unittest.TestCase):
+    def setUp(self):
+        self.service = DataFilterService(_app_state())
+        self.now = 1000.0
+        # 5 kW over one 10 s poll, x3 safety margin, plus 0.1 kWh headroom
+        self.max_increase_kwh = 5.0 * POLL_SECONDS / 3600 * 3.0 + 0.1
+        self.strict_kwh = self.max_increase_kwh * self.service.config.strict_spike_multiplier
+
+    def _feed(self, value):
+        """Filters one PV energy reading while the last good value stays held."""
+        self.now += POLL_SECONDS
+        return self.service._filter_energy_value(
+            PV_KEY, value, LAST_GOOD_KWH, now=self.now, hour=12, is_reset_time=False
+        )
+
+    def test_exact_repeat_is_confirmed(self):
+        spike = LAST_GOOD_KWH + 1.0
+        self.assertEqual(self._feed(spike), LAST_GOOD_KWH)
+        self.assertEqual(self._feed(spike), LAST_GOOD_KWH)
+        self.assertEqual(self._feed(spike), spike)
+        self.assertNotIn(PV_KEY, self.service.potential_spikes)
+
+    def test_reading_rising_within_allowance_is_confirmed(self):
+        step = self.max_increase_kwh / 2
+        readings = [LAST_GOOD_KWH + 1.0 + i * step for i in range(3)]
+        self.assertEqual(self._feed(readings[0]), LAST_GOOD_KWH)
+        self.assertEqual(self._feed(readings[1]), LAST_GOOD_KWH)
+        self.assertEqual(self._feed(readings[2]), readings[2])
+
+    def test_reading_beyond_allowance_resets_count(self):
+        first = LAST_GOOD_KWH + 1.0
+        jumped = first + self.max_increase_kwh * 2
+        self.assertLess(jumped - LAST_GOOD_KWH, self.strict_kwh)
+        self.assertEqual(self._feed(first), LAST_GOOD_KWH)
+        self.assertEqual(self._feed(first), LAST_GOOD_KWH)
+        self.assertEqual(self._feed(jumped), LAST_GOOD_KWH)
+        self.assertEqual(self.service.potential_spikes[PV_KEY], (jumped, 1))
+        self.assertEqual(self._feed(jumped), LAST_GOOD_KWH)
+
+    def test_reading_beyond_strict_tier_is_rejected_outright(self):
+        absurd = LAST_GOOD_KWH + self.strict_kwh + 1.0
+        for _ in range(self.service.config.spike_confirmation_threshold + 1):
+            self.assertEqual(self._feed(absurd), LAST_GOOD_KWH)
+        self.assertNotIn(PV_KEY, self.service.potential_spikes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+# test_plugins/test_plugin_interface.py
+"""Unit tests for plugin_interface config helpers and DevicePlugin base.
+
+GitHub Project: https://github.com/jcvsite/solar-monitoring
+License: MIT
+"""
+import inspect
+import logging
+import os
+import sys
+import unittest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from plugins.plugin_interface import (
+    DevicePlugin,
+    parse_config_bulk,
+    parse_config_float,
+    parse_config_int,
+    parse_config_str,
+)
+from plugins.battery.bms_plugin_base import BMSPluginBase
+from plugins.inverter.modbus_inverter_base import ModbusInverterPluginBase
+
+
+class TestParseConfig(unittest.TestCase):
+    def test_int_strips_inline_comment(self):
+        cfg = {"baud_rate": " 115200 ; RS485 adapter"}
+        self.assertEqual(parse_config_int(cfg, "baud_rate", 9600), 115200)
+
+    def test_int_default_when_missing(self):
+        self.assertEqual(parse_config_int({}, "baud_rate", 9600), 9600)
+
+    def test_int_invalid_raises_every_time(self):
+        cfg = {"tcp_port": "abc ; typo"}
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                parse_config_int(cfg, "tcp_port", 502)
+
+    def test_float_strips_inline_comment(self):
+        cfg = {"modbus_timeout_seconds": "2.5;seconds"}
+        self.assertEqual(parse_config_float(cfg, "modbus_timeout_seconds", 5.0), 2.5)
+
+    def test_str_comment_only_is_none(self):
+        self.assertIsNone(parse_config_str({"tcp_host": "  ; set me"}, "tcp_host", "x"))
+        self.assertIsNone(parse_config_str({}, "tcp_host"))
+
+    def test_native_values_skip_string_parsing(self):
+        self.assertEqual(parse_config_int({"tcp_port": 1502}, "tcp_port", 502), 1502)
+        self.assertEqual(parse_config_float({"timeout": 3}, "timeout", 5.0), 3.0)
+        self.assertIsInstance(parse_config_float({"timeout": 3}, "timeout", 5.0), float)
+        with self.assertRaises(ValueError):
+            parse_config_int({"tcp_port": 2.5}, "tcp_port", 502)
+
+    def test_str_same_raw_value_different_kinds(self):
+        cfg = {"slave_address": "1 ; unit id"}
+        self.assertEqual(parse_config_str(cfg, "slave_address"), "1")
+        self.assertEqual(parse_config_int(cfg, "slave_address", 0), 1)
+        self.assertEqual(parse_config_float(cfg, "slave_address", 0.0), 1.0)
+
+    def test_bulk_matches_individual_parsers(self):
+        cfg = {"baud_rate": "19200 ; rs485", "timeout": "2.5", "tcp_host": " 10.0.0.5 "}
+        schema = {"baud_rate": (int, 9600), "timeout": (float, 5.0), "tcp_host": (str, None), "serial_port": (str, None)}
+        self.assertEqual(
+            parse_config_bulk(cfg, schema),
+            {"baud_rate": 19200, "timeout": 2.5, "tcp_host": "10.0.0.5", "serial_port": None},
+        )
+
+    def test_modbus_base_schema_uses_subclass_defaults(self):
+        from plugins.inverter.sofar_modbus_plugin import SofarModbusPlugin
+        self.assertEqual(SofarModbusPlugin.CONFIG_SCHEMA["baud_rate"], (int, SofarModbusPlugin.default_baud))
+        self.assertEqual(SofarModbusPlugin.CONFIG_SCHEMA["tcp_port"], (int, SofarModbusPlugin.default_tcp_port))
+
+    def test_modbus_subclass_declared_schema_is_merged(self):
+        class _VendorBase(ModbusInverterPluginBase):
+            default_baud = 19200
+            CONFIG_SCHEMA = {"battery_count": (int, 1), "modbus_timeout_seconds": (str, "3")}
+
+        class _VendorModel(_VendorBase):
+            default_tcp_port = 8899
+            CONFIG_SCHEMA = {"phases": (int, 3)}
+
+        schema = _VendorModel.CONFIG_SCHEMA
+        self.assertEqual(schema["battery_count"], (int, 1))
+        self.assertEqual(schema["phases"], (int, 3))
+        self.assertEqual(schema["modbus_timeout_seconds"], (str, "3"))
+        self.assertEqual(schema["baud_rate"], (int, 19200))
+        self.assertEqual(schema["tcp_port"], (int, 8899))
+        self.assertEqual(set(ModbusInverterPluginBase._build_config_schema()) - set(schema), set())
+        self.assertNotIn("phases", _VendorBase.CONFIG_SCHEMA)
+        values = parse_config_bulk({"battery_count": "2 ; packs"}, schema)
+        self.assertEqual(values["battery_count"], 2)
+
+    def test_modbus_declared_keys_are_parsed_onto_instance(self):
+        class _VendorPlugin(ModbusInverterPluginBase):
+            CONFIG_SCHEMA = {"battery_count": (int, 1)}
+            name = "vendor"
+            pretty_name = "Vendor"
+
+            def read_static_data(self):
+                return {}
+
+            def read_dynamic_data(self):
+                return {}
+
+        plugin = _VendorPlugin("x", {"battery_count": "2 ; packs", "tcp_port": "1502"}, logging.getLogger("test"))
+        self.assertEqual(plugin.parsed_config["battery_count"], 2)
+        self.assertEqual(plugin.parsed_config["tcp_port"], 1502)
+        self.assertEqual(plugin.tcp_port, 1502)
+        defaults = _VendorPlugin("y", {}, logging.getLogger("test"))
+        self.assertEqual(defaults.parsed_config["battery_count"], 1)
+
+
+class _MinimalPlugin(DevicePlugin):
+    name = "minimal"
+    pretty_name = "Minimal"
+
+    def connect(self):
+        return True
+
+    def disconnect(self):
+        pass
+
+    def read_static_data(self):
+        return {}
+
+    def read_dynamic_data(self):
+        return {}
+
+
+class TestDevicePluginAbstractness(unittest.TestCase):
+    def test_partial_bases_stay_abstract(self):
+        """Plugin loaders skip classes for which inspect.isabstract() is True."""
+        for cls in (DevicePlugin, ModbusInverterPluginBase, BMSPluginBase):
+            self.assertTrue(inspect.isabstract(cls), cls.__name__)
+
+    def test_abstract_class_cannot_be_instantiated(self):
+        with self.assertRaises(TypeError):
+            DevicePlugin("x", {}, logging.getLogger("test"))
+
+    def test_complete_subclass_is_concrete(self):
+        self.assertFalse(inspect.isabstract(_MinimalPlugin))
+        plugin = _MinimalPlugin("x", {}, logging.getLogger("test"))
+        self.assertFalse(plugin.is_connected)
+        self.assertIs(type(type(plugin)), type)
+
+    def test_is_connected_is_plain_attribute_with_legacy_alias(self):
+        plugin = _MinimalPlugin("x", {}, logging.getLogger("test"))
+        plugin.is_connected = True
+        self.assertTrue(plugin._is_connected_flag)
+        plugin._is_connected_flag = False
+        self.assertFalse(plugin.is_connected)
+
+    def test_is_connected_property_override_still_supported(self):
+        """Plugins written against the old property API override is_connected read-only."""
+
+        class _OverridingPlugin(_MinimalPlugin):
+            @property
+            def is_connected(self):
+                return self._is_connected_flag and self.client is not None
+
+            def connect(self):
+                self.client = object()
+                self._is_connected_flag = True
+                return True
+
+        plugin = _OverridingPlugin("x", {}, logging.getLogger("test"))
+        self.assertFalse(plugin.is_connected)
+        self.assertFalse(plugin._is_connected_flag)
+        plugin.connect()
+        self.assertTrue(plugin.is_connected)
+        plugin.client = None
+        self.assertFalse(plugin.is_connected)
+
+
+if __name__ == "__main__":
+    unittest.main()
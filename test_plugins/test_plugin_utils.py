@@ -0,0 +1,55 @@
+# test_plugins/test_plugin_utils.py
+"""Unit tests for plugin network utility helpers.
+
+GitHub Project: https://github.com/jcvsite/solar-monitoring
+License: MIT
+"""
+import os
+import struct
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from plugins import plugin_utils
+from plugins.plugin_utils import _build_icmp_echo, _icmp_checksum, _ping_socket, check_icmp_ping
+
+
+class TestIcmpPacket(unittest.TestCase):
+    def test_echo_request_header(self):
+        packet = _build_icmp_echo(0x1234, 7)
+        icmp_type, code, _, ident, seq = struct.unpack("!BBHHH", packet[:8])
+        self.assertEqual((icmp_type, code, ident, seq), (8, 0, 0x1234, 7))
+
+    def test_checksum_verifies_to_zero(self):
+        """A packet including its own checksum must sum to 0xFFFF (checksum 0)."""
+        for ident, seq in ((0, 1), (0xFFFF, 0xFFFF), (4321, 42)):
+            self.assertEqual(_icmp_checksum(_build_icmp_echo(ident, seq)), 0)
+
+    def test_checksum_odd_length(self):
+        self.assertEqual(_icmp_checksum(b"\x01"), 0xFEFF)
+
+
+class TestIcmpPingFallback(unittest.TestCase):
+    def test_ipv6_host_skips_in_process_socket(self):
+        with mock.patch.object(plugin_utils, "_open_icmp_socket") as open_sock:
+            self.assertIsNone(_ping_socket("::1", 1, 1))
+        open_sock.assert_not_called()
+
+    def test_ipv6_host_uses_system_ping(self):
+        completed = subprocess.CompletedProcess(
+            args=[], returncode=0,
+            stdout=b"rtt min/avg/max/mdev = 0.030/0.045/0.060/0.010 ms\n", stderr=b"",
+        )
+        with mock.patch.object(plugin_utils.subprocess, "run", return_value=completed) as run:
+            ok, _, _ = check_icmp_ping("::1")
+        self.assertTrue(ok)
+        self.assertEqual(run.call_args[0][0][-1], "::1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+# test_plugins/test_srne_modbus_plugin.py
+"""Unit tests for the SRNE plugin's async Modbus TCP path.
+
+GitHub Project: https://github.com/jcvsite/solar-monitoring
+License: MIT
+"""
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+import unittest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from plugins.inverter.srne_modbus_plugin import SrneModbusPlugin
+
+
+class _SilentTcpServer:
+    """Accepts TCP connections and holds them open without ever replying."""
+
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen(8)
+        self.port = self.sock.getsockname()[1]
+        self._conns = []
+        self._thread = threading.Thread(target=self._accept_loop, daemon=True)
+        self._thread.start()
+
+    def _accept_loop(self):
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            self._conns.append(conn)
+
+    def close(self):
+        self.sock.close()
+        for conn in self._conns:
+            conn.close()
+
+
+class TestSrneAsyncTcpTimeout(unittest.TestCase):
+    def setUp(self):
+        self.server = _SilentTcpServer()
+        self.addCleanup(self.server.close)
+        config = {
+            "connection_type": "tcp",
+            "tcp_host": "127.0.0.1",
+            "tcp_port": str(self.server.port),
+            "modbus_timeout_seconds": "1",
+        }
+        self.plugin = SrneModbusPlugin("srne_test", config, logging.getLogger("test_srne"))
+        self.addCleanup(self.plugin.disconnect)
+
+    def test_unanswered_read_disconnects_within_timeout(self):
+        self.assertTrue(self.plugin.connect())
+        self.assertTrue(self.plugin.is_connected)
+
+        start = time.monotonic()
+        result = self.plugin.read_dynamic_data()
+        elapsed = time.monotonic() - start
+
+        self.assertIsNone(result)
+        self.assertFalse(self.plugin.is_connected)
+        # One Modbus timeout, plus a little slack for cancelling the request and closing the client
+        self.assertLess(elapsed, self.plugin.modbus_timeout_seconds + 0.5)
+        self.assertIn("timed out", self.plugin.last_error_message)
+
+
+if __name__ == "__main__":
+    unittest.main()